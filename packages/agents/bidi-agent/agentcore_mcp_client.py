@@ -1,5 +1,7 @@
 import hashlib
+import hmac
 from collections.abc import Generator
+from functools import lru_cache
 from typing import Any
 
 import httpx
@@ -8,6 +10,58 @@ from botocore.awsrequest import AWSRequest
 from mcp.client.streamable_http import streamablehttp_client
 from strands.tools.mcp.mcp_client import MCPClient
 
+# SHA-256 of an empty payload. Most MCP control requests carry no body,
+# so the digest can be reused instead of hashed on every request.
+_EMPTY_SHA256_HEX = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+
+
+def _sha256_hex(content: bytes) -> str:
+    """Hash a request body through a memoryview so large payloads are never copied."""
+    digest = hashlib.sha256()
+    digest.update(memoryview(content))
+    return digest.digest().hex()
+
+
+def _hmac_sha256(key: bytes, msg: str) -> bytes:
+    return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
+
+
+@lru_cache(maxsize=8)
+def _derive_signing_key(access_key: str, secret_key: str, date_stamp: str, region: str, service: str) -> bytes:
+    """Derive the SigV4 signing key. Both key parts are part of the cache key so rotated credentials miss."""
+    k_date = _hmac_sha256(f"AWS4{secret_key}".encode(), date_stamp)
+    k_region = _hmac_sha256(k_date, region)
+    k_service = _hmac_sha256(k_region, service)
+    return _hmac_sha256(k_service, "aws4_request")
+
+
+class _CachedSigV4Auth(SigV4Auth):
+    """SigV4Auth that reuses the derived signing key and credential scope for the same credentials and day."""
+
+    def __init__(self, credentials: Any, service_name: str, region_name: str):
+        super().__init__(credentials, service_name, region_name)
+        # (date_stamp, scope), swapped as one tuple so concurrent signers never see a mismatched pair
+        self._scope_cache: tuple[str, str] = ("", "")
+
+    def credential_scope(self, request: AWSRequest) -> str:
+        date_stamp = request.context["timestamp"][0:8]
+        cached_date, scope = self._scope_cache
+        if cached_date != date_stamp:
+            scope = f"{date_stamp}/{self._region_name}/{self._service_name}/aws4_request"
+            self._scope_cache = (date_stamp, scope)
+        return scope
+
+    def signature(self, string_to_sign: str, request: AWSRequest) -> str:
+        credentials = self.credentials
+        signing_key = _derive_signing_key(
+            credentials.access_key,
+            credentials.secret_key,
+            request.context["timestamp"][0:8],
+            self._region_name,
+            self._service_name,
+        )
+        return hmac.new(signing_key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+
 
 class SigV4HTTPXAuth(httpx.Auth):
     """HTTPX Auth class that signs requests with AWS SigV4."""
@@ -16,25 +70,29 @@ class SigV4HTTPXAuth(httpx.Auth):
         self.credentials = credentials
         self.service = "bedrock-agentcore"
         self.region = region
-        self.signer = SigV4Auth(credentials, self.service, region)
+        self.signer = _CachedSigV4Auth(credentials, self.service, region)
 
     def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
-        headers = dict(request.headers)
+        # Mutate the httpx headers in place instead of copying them back and forth
+        headers = request.headers
 
         headers.pop("connection", None)
-        headers["x-amz-content-sha256"] = hashlib.sha256(request.content if request.content else b"").hexdigest()
+        content = request.content
+        headers["x-amz-content-sha256"] = _sha256_hex(content) if content else _EMPTY_SHA256_HEX
 
         aws_request = AWSRequest(
             method=request.method,
             url=str(request.url),
-            data=request.content,
+            data=content,
             headers=headers,
         )
 
         self.signer.add_auth(aws_request)
 
-        request.headers.clear()
-        request.headers.update(dict(aws_request.headers))
+        # Only the signing headers (Authorization, X-Amz-Date, ...) differ after add_auth
+        for key, value in aws_request.headers.items():
+            if headers.get(key) != value:
+                headers[key] = value
 
         yield request
 
@@ -1,10 +1,11 @@
 """MCP client and tools configuration for bidi-agent."""
 
 import logging
-from datetime import datetime
+from datetime import UTC, datetime, tzinfo
+from functools import lru_cache
+from zoneinfo import ZoneInfo, available_timezones
 
 import boto3
-import pytz
 from strands.tools.mcp.mcp_client import MCPClient
 
 from mcp import StdioServerParameters
@@ -27,6 +28,23 @@ def get_duckduckgo_mcp_client() -> MCPClient:
     )
 
 
+@lru_cache(maxsize=1)
+def _boto_session() -> boto3.Session:
+    return boto3.Session()
+
+
+_cached_credentials = None
+
+
+def _credentials():
+    # Refreshable credentials renew themselves, so the same object can be shared across clients.
+    # A None result (no credentials found yet) is not cached so the next client retries the chain.
+    global _cached_credentials
+    if _cached_credentials is None:
+        _cached_credentials = _boto_session().get_credentials()
+    return _cached_credentials
+
+
 def get_mcp_client() -> MCPClient | None:
     """Get MCP client for AgentCore Gateway."""
     config = get_config()
@@ -34,42 +52,68 @@ def get_mcp_client() -> MCPClient | None:
         logger.warning("MCP_GATEWAY_URL not configured, MCP tools will not be available")
         return None
 
-    session = boto3.Session()
-    credentials = session.get_credentials()
-
     return AgentCoreGatewayMCPClient.with_iam_auth(
         gateway_url=config.mcp_gateway_url,
-        credentials=credentials,
+        credentials=_credentials(),
         region=config.aws_region,
     )
 
 
-async def get_date_and_time(tool_input: dict, context: dict) -> dict:
-    """Get the current date and time in the specified timezone."""
-    tz_name = tool_input.get("timezone") or context.get("timezone") or "UTC"
+# Indexed by datetime.weekday(); fields are formatted from attributes rather than
+# strftime, which also keeps %A/%p output independent of the process locale
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
 
+@lru_cache(maxsize=1)
+def _zone_names_by_lower() -> dict[str, str]:
+    return {name.lower(): name for name in available_timezones()}
+
+
+@lru_cache(maxsize=128)
+def _get_tz(tz_name: str) -> tuple[tzinfo, str]:
+    """Resolve an IANA timezone name, falling back to UTC when it is unknown.
+
+    ZoneInfo keys are case-sensitive on Linux, so a miss is retried against the
+    canonical spelling (e.g. "asia/seoul" -> "Asia/Seoul"), as pytz used to match.
+    """
     try:
-        tz = pytz.timezone(tz_name)
+        return ZoneInfo(tz_name), tz_name
     except Exception:
-        tz = pytz.UTC
-        tz_name = "UTC"
+        # ZoneInfoNotFoundError, or ValueError for malformed keys such as "../etc"
+        pass
+    canonical = _zone_names_by_lower().get(tz_name.lower())
+    if canonical is None:
+        return UTC, "UTC"
+    return ZoneInfo(canonical), canonical
+
+
+def get_date_and_time(tool_input: dict, context: dict) -> dict:
+    """Get the current date and time in the specified timezone."""
+    tz_name = tool_input.get("timezone") or context.get("timezone") or "UTC"
+
+    if tz_name == "UTC":
+        tz = UTC
+    else:
+        tz, tz_name = _get_tz(tz_name)
 
     now = datetime.now(tz)
+    year, month, day = now.year, now.month, now.day
+    hour, minute = now.hour, now.minute
 
     return {
-        "currentTime": now.strftime("%H:%M:%S"),
-        "formattedTime": now.strftime("%I:%M %p"),
-        "date": now.strftime("%Y-%m-%d"),
-        "year": now.year,
-        "month": now.month,
-        "day": now.day,
-        "dayOfWeek": now.strftime("%A"),
+        "currentTime": f"{hour:02d}:{minute:02d}:{now.second:02d}",
+        "formattedTime": f"{hour % 12 or 12:02d}:{minute:02d} {'AM' if hour < 12 else 'PM'}",
+        "date": f"{year:04d}-{month:02d}-{day:02d}",
+        "year": year,
+        "month": month,
+        "day": day,
+        "dayOfWeek": _WEEKDAYS[now.weekday()],
         "timezone": tz_name,
     }
 
 
-# Built-in tools that don't require MCP
-BUILTIN_TOOLS = [
+# Built-in tools that don't require MCP (shared, treat as read-only)
+BUILTIN_TOOLS = (
     {
         "name": "getDateAndTimeTool",
         "description": "Get the current date and time. Use this when the user asks about the current time, date, day of week, or any time-related questions.",
@@ -86,22 +130,28 @@ BUILTIN_TOOLS = [
             }
         },
     },
-]
+)
 
 
-def get_tools() -> list[dict]:
+def get_tools() -> tuple[dict, ...]:
     """Get all tool specifications (built-in only, MCP tools are added dynamically)."""
-    return BUILTIN_TOOLS.copy()
+    return BUILTIN_TOOLS
 
 
-TOOL_HANDLERS = {
+# Sync handlers are pure CPU work and are called directly; async handlers are awaited
+_SYNC_HANDLERS = {
     "getDateAndTimeTool": get_date_and_time,
 }
 
+_ASYNC_HANDLERS: dict = {}
+
 
 async def execute_builtin_tool(tool_name: str, tool_input: dict, context: dict) -> dict | None:
     """Execute a built-in tool if it exists."""
-    handler = TOOL_HANDLERS.get(tool_name)
+    handler = _SYNC_HANDLERS.get(tool_name)
+    if handler:
+        return handler(tool_input, context)
+    handler = _ASYNC_HANDLERS.get(tool_name)
     if handler:
         return await handler(tool_input, context)
     return None
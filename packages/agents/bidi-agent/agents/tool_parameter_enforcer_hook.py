@@ -9,7 +9,15 @@ class ToolParameterEnforcerHook(HookProvider):
         self.user_id = user_id
         self.project_id = project_id
 
+        # Parameters injected into every MCP tool call, built once per session
+        self._injection: dict[str, str] = {
+            key: value for key, value in (("user_id", user_id), ("project_id", project_id)) if value
+        }
+
     def register_hooks(self, registry: HookRegistry, **kwargs) -> None:
+        # Nothing to inject, so skip hook dispatch for every tool call entirely
+        if not self._injection:
+            return
         registry.add_callback(BeforeToolCallEvent, self._enforce_parameters)
 
     def _enforce_parameters(self, event: BeforeToolCallEvent) -> None:
@@ -19,14 +27,8 @@ class ToolParameterEnforcerHook(HookProvider):
         tool_name = event.selected_tool.tool_name
 
         # MCP tools are prefixed with server name (e.g., "search___hybrid_search")
-        is_mcp_tool = "___" in tool_name
-
-        if not is_mcp_tool:
+        if "___" not in tool_name:
             return
 
         # Inject user_id and project_id for all MCP tools
-        if self.user_id:
-            event.tool_use["input"]["user_id"] = self.user_id
-
-        if self.project_id:
-            event.tool_use["input"]["project_id"] = self.project_id
+        event.tool_use["input"].update(self._injection)
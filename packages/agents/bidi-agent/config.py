@@ -41,6 +41,8 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 logger = logging.getLogger(__name__)
 
+__all__ = ["BidiModelType", "Config", "create_bidi_model", "get_config"]
+
 
 class BidiModelType(str, Enum):
     """Supported bidirectional voice model types."""
@@ -50,6 +52,17 @@ class BidiModelType(str, Enum):
     OPENAI = "openai"  # OpenAI Realtime (API key required)
 
 
+# Supported voices per model; unknown voices fall back to the model default
+_NOVA_VOICES = frozenset({"tiffany", "matthew"})
+_NOVA_DEFAULT_VOICE = "tiffany"
+_GEMINI_VOICES = frozenset({"Puck", "Charon", "Kore", "Fenrir", "Aoede"})
+_GEMINI_DEFAULT_VOICE = "Kore"
+_OPENAI_VOICES = frozenset(
+    {"alloy", "ash", "ballad", "coral", "echo", "sage", "shimmer", "verse", "marin", "cedar"}
+)
+_OPENAI_DEFAULT_VOICE = "alloy"
+
+
 class Config(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env.local", env_file_encoding="utf-8", extra="ignore"
@@ -98,8 +111,6 @@ def create_bidi_model(
         # OpenAI Realtime (API key required)
         model = create_bidi_model("openai", api_key="sk-...", voice="alloy")
     """
-    config = get_config()
-
     # =========================================================================
     # Nova Sonic - AWS Bedrock Native Model
     # =========================================================================
@@ -110,14 +121,14 @@ def create_bidi_model(
         from strands.experimental.bidi.models import BidiNovaSonicModel
 
         # Validate Nova Sonic voice option (defaults to tiffany if invalid)
-        nova_voice = voice if voice in ["tiffany", "matthew"] else "tiffany"
+        nova_voice = voice if voice in _NOVA_VOICES else _NOVA_DEFAULT_VOICE
         logger.info(f"Creating nova_sonic model with voice={nova_voice}")
         return BidiNovaSonicModel(
             model_id="amazon.nova-2-sonic-v1:0",
             provider_config={
                 "audio": {"voice": nova_voice},
             },
-            client_config={"region": config.aws_region},
+            client_config={"region": get_config().aws_region},
         )
 
     # =========================================================================
@@ -133,7 +144,7 @@ def create_bidi_model(
             raise ValueError("API key is required for Gemini model")
 
         # Validate Gemini voice option (defaults to Kore if invalid)
-        gemini_voice = voice if voice in ["Puck", "Charon", "Kore", "Fenrir", "Aoede"] else "Kore"
+        gemini_voice = voice if voice in _GEMINI_VOICES else _GEMINI_DEFAULT_VOICE
         logger.info(f"Creating Gemini model with voice={gemini_voice}")
 
         return BidiGeminiLiveModel(
@@ -158,7 +169,7 @@ def create_bidi_model(
             raise ValueError("API key is required for OpenAI model")
 
         # Validate OpenAI voice option (defaults to alloy if invalid)
-        openai_voice = voice if voice in ["alloy", "ash", "ballad", "coral", "echo", "sage", "shimmer", "verse", "marin", "cedar"] else "alloy"
+        openai_voice = voice if voice in _OPENAI_VOICES else _OPENAI_DEFAULT_VOICE
         logger.info(f"Creating OpenAI model with voice={openai_voice}")
 
         return BidiOpenAIRealtimeModel(
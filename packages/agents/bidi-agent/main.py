@@ -48,20 +48,29 @@ OpenAI/Gemini can send larger audio chunks than Nova Sonic.
 Example: OpenAI sends 40KB+ audio chunk -> Exceeds AgentCore 32KB limit -> Connection drops
 
 Solution: Split into 24KB chunks
-- 24KB audio + JSON overhead (~52 bytes) = ~24KB < 32KB limit
-- Base64-encoded audio is already a string, no additional encoding needed
+- Audio goes out as binary frames: 4-byte sample rate header + raw PCM
+- 24KB audio + 4-byte header = ~24KB < 32KB limit
 
 Reference: https://docs.aws.amazon.com/bedrock-agentcore/latest/devguide/runtime-get-started-websocket.html
 """
 
 import asyncio
-import json
+import base64
 import logging
+import operator
+import struct
 import sys
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
 
 import boto3
+import orjson
+from botocore.config import Config as BotoConfig
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 
@@ -211,8 +220,137 @@ async def lifespan(app: FastAPI):
             logger.error(f"Error closing MCP client: {e}")
 
 
+MAX_TRACKED_TOOL_USE_IDS = 1024
+MAX_CONCURRENT_TOOLS = 8
+
+# Per event class accessor for the tool use payload, resolved on first sight
+_TOOL_USE_GETTERS: dict[type, Callable[[Any], dict | None]] = {}
+
+
+def get_tool_use(event: Any) -> dict | None:
+    """Return the tool use dict carried by a tool use stream event."""
+    try:
+        return _TOOL_USE_GETTERS[type(event)](event)
+    except KeyError:
+        pass
+    for attr in ("current_tool_use", "tool_use"):
+        if getattr(event, attr, None) is not None:
+            getter = operator.attrgetter(attr)
+            break
+    else:
+        if not hasattr(event, "get"):
+            return None
+        getter = operator.methodcaller("get", "current_tool_use")
+    # Only cache once the shape is known from an event that carries a payload
+    tool_use = getter(event)
+    if tool_use is not None:
+        _TOOL_USE_GETTERS[type(event)] = getter
+    return tool_use
+
+
+# Outbound binary audio frame header: little-endian u32 sample rate, then PCM
+AUDIO_FRAME_HEADER = struct.Struct("<I")
+
+
+class OutboundBatcher:
+    """Coalesce small outbound control events into a single WebSocket frame.
+
+    Transcript deltas, response_start, tool_use acks etc. are tiny, but each one
+    costs a full frame through the AgentCore proxy (250 frames/sec limit).
+    Events queued within BATCH_WINDOW_SECONDS are sent as one
+    {"type": "batch", "items": [...]} message; a lone event is sent as-is.
+    Call flush() before sending anything directly so ordering is preserved.
+    """
+
+    BATCH_WINDOW_SECONDS = 0.01
+    # Keeps a batch of transcript/tool events well under the 32KB frame limit
+    MAX_BATCH_ITEMS = 16
+
+    def __init__(self, send: Callable[[dict], Awaitable[None]]):
+        self._send = send
+        self._pending: list[dict] = []
+        self._flush_task: asyncio.Task | None = None
+
+    async def put(self, payload: dict) -> None:
+        self._pending.append(payload)
+        if len(self._pending) >= self.MAX_BATCH_ITEMS:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.BATCH_WINDOW_SECONDS)
+        self._flush_task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning(f"Failed to flush outbound batch: {e}")
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        items, self._pending = self._pending, []
+        if len(items) == 1:
+            await self._send(items[0])
+        else:
+            await self._send({"type": "batch", "items": items})
+
+    def cancel(self) -> None:
+        """Drop the scheduled flush without sending; safe when the socket is already gone."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+    async def close(self) -> None:
+        self.cancel()
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.debug(f"Dropped {len(self._pending)} outbound events on close: {e}")
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last timestamp formatted
+_iso_second_cache: tuple[int, str] = (-1, "")
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time in datetime.isoformat() form.
+
+    Only the microseconds change between calls within a second, so the
+    date/time prefix is formatted once per second and reused.
+    """
+    global _iso_second_cache
+    ns = time.time_ns()
+    second = ns // 1_000_000_000
+    if _iso_second_cache[0] != second:
+        _iso_second_cache = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+    return f"{_iso_second_cache[1]}.{ns // 1000 % 1_000_000:06d}+00:00"
+
+
+# Shared by all connections so concurrent sessions don't each spin up threads
+# (and boto connections) for transcript writes
+_TRANSCRIPT_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="transcript")
+
+_S3_CLIENT_CONFIG = BotoConfig(
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
+
+@lru_cache(maxsize=1)
+def _boto_session() -> boto3.Session:
+    # One session for every S3 client (prompt fetch, each S3SessionManager) so
+    # the S3 service model, endpoint data and credentials are loaded once
+    return boto3.Session()
+
+
 class TranscriptSaver:
-    """Save voice transcripts to S3 using Strands SDK S3SessionManager."""
+    """Save voice transcripts to S3 using Strands SDK S3SessionManager.
+
+    Messages are queued and written by a background task so the blocking S3
+    PUT never stalls audio forwarding on the event loop.
+    """
 
     def __init__(
         self,
@@ -224,6 +362,8 @@ class TranscriptSaver:
     ):
         self.session_id = session_id
         self.message_index = 0
+        self._queue: asyncio.Queue[SessionMessage | None] = asyncio.Queue()
+        self._writer: asyncio.Task | None = None
         self.enabled = bool(bucket and user_id and project_id and session_id)
         # Store agent_id with model type for distinguishing voice sessions
         # e.g., "voice_nova_sonic", "voice_gemini", "voice_openai"
@@ -235,47 +375,73 @@ class TranscriptSaver:
                 session_id=session_id,
                 bucket=bucket,
                 prefix=prefix,
+                boto_session=_boto_session(),
+                boto_client_config=_S3_CLIENT_CONFIG,
             )
         else:
             self.session_manager = None
 
-    def save_transcript(self, role: str, text: str) -> None:
-        """Save a transcript message to S3 using SDK."""
-        if not self.enabled or not self.session_manager:
+    def start(self) -> None:
+        """Start the background writer; must be called from the event loop."""
+        if self.enabled and self._writer is None:
+            self._writer = asyncio.create_task(self._drain())
+
+    async def close(self) -> None:
+        """Flush queued messages and stop the background writer."""
+        if self._writer is None:
             return
+        self._queue.put_nowait(None)
+        await self._writer
+        self._writer = None
 
-        now = datetime.now(timezone.utc).isoformat()
+    async def _drain(self) -> None:
+        # Single consumer keeps S3 writes in message_index order
+        loop = asyncio.get_running_loop()
+        while (session_message := await self._queue.get()) is not None:
+            await loop.run_in_executor(_TRANSCRIPT_EXECUTOR, self._write, session_message)
 
+    def _write(self, session_message: SessionMessage) -> None:
         try:
-            message = Message(
-                role=role,
-                content=[ContentBlock(text=text)],
+            self.session_manager.create_message(
+                session_id=self.session_id,
+                agent_id=self.agent_id,
+                session_message=session_message,
             )
-            session_message = SessionMessage(
+            logger.debug(f"Saved message_{session_message.message_id}")
+        except Exception as e:
+            logger.error(f"Failed to save message_{session_message.message_id}: {e}")
+
+    def _enqueue(self, message: Message) -> None:
+        now = _utc_now_iso()
+        self._queue.put_nowait(
+            SessionMessage(
                 message=message,
                 message_id=self.message_index,
                 created_at=now,
                 updated_at=now,
             )
-            self.session_manager.create_message(
-                session_id=self.session_id,
-                agent_id=self.agent_id,
-                session_message=session_message,
+        )
+        self.message_index += 1
+
+    def save_transcript(self, role: str, text: str) -> None:
+        """Queue a transcript message for saving to S3."""
+        if not self.enabled or not self.session_manager:
+            return
+
+        self._enqueue(
+            Message(
+                role=role,
+                content=[ContentBlock(text=text)],
             )
-            logger.debug(f"Saved transcript message_{self.message_index}")
-            self.message_index += 1
-        except Exception as e:
-            logger.error(f"Failed to save transcript: {e}")
+        )
 
     def save_tool_result(self, tool_name: str, tool_use_id: str, status: str) -> None:
-        """Save a tool result as a proper toolResult content block."""
+        """Queue a tool result as a proper toolResult content block."""
         if not self.enabled or not self.session_manager:
             return
 
-        now = datetime.now(timezone.utc).isoformat()
-
-        try:
-            message = Message(
+        self._enqueue(
+            Message(
                 role="assistant",
                 content=[ContentBlock(toolResult={
                     "toolUseId": tool_use_id,
@@ -283,21 +449,7 @@ class TranscriptSaver:
                     "content": [{"text": tool_name}],
                 })],
             )
-            session_message = SessionMessage(
-                message=message,
-                message_id=self.message_index,
-                created_at=now,
-                updated_at=now,
-            )
-            self.session_manager.create_message(
-                session_id=self.session_id,
-                agent_id=self.agent_id,
-                session_message=session_message,
-            )
-            logger.debug(f"Saved tool_result message_{self.message_index}: {tool_name}")
-            self.message_index += 1
-        except Exception as e:
-            logger.error(f"Failed to save tool_result: {e}")
+        )
 
 
 TIMEZONE_TO_LANGUAGE: dict[str, str] = {
@@ -354,29 +506,55 @@ When performing web searches, you MUST follow these rules strictly:
 6. Always cite the sources you used with their URLs"""
 
 
+VOICE_PROMPT_KEY = "__prompts/voice/system_prompt.txt"
+VOICE_PROMPT_TTL_SECONDS = 300
+
+# (fetched_at monotonic time, prompt); the prompt object rarely changes
+_voice_prompt_cache: tuple[float, str | None] | None = None
+
+
+@lru_cache(maxsize=1)
+def _s3_client():
+    return _boto_session().client("s3", config=_S3_CLIENT_CONFIG)
+
+
 def fetch_voice_system_prompt() -> str | None:
-    """Fetch voice system prompt from S3."""
+    """Fetch voice system prompt from S3, cached for VOICE_PROMPT_TTL_SECONDS."""
+    global _voice_prompt_cache
     config = get_config()
     if not config.agent_storage_bucket_name:
         return None
 
-    s3 = boto3.client("s3")
-    key = "__prompts/voice/system_prompt.txt"
+    now = time.monotonic()
+    if _voice_prompt_cache and now - _voice_prompt_cache[0] < VOICE_PROMPT_TTL_SECONDS:
+        return _voice_prompt_cache[1]
 
+    s3 = _s3_client()
     try:
         response = s3.get_object(
             Bucket=config.agent_storage_bucket_name,
-            Key=key,
+            Key=VOICE_PROMPT_KEY,
         )
-        return response["Body"].read().decode("utf-8")
+        prompt = response["Body"].read().decode("utf-8")
+    except s3.exceptions.NoSuchKey:
+        prompt = None
     except Exception as e:
+        # Transient failures are not cached so the next connection retries
         logger.warning(f"Failed to fetch voice system prompt: {e}")
         return None
 
+    _voice_prompt_cache = (now, prompt)
+    return prompt
+
 
 def build_system_prompt(timezone: str, has_mcp_tools: bool = False, has_web_search: bool = False) -> str:
     base_prompt = fetch_voice_system_prompt() or BASE_SYSTEM_PROMPT
+    return _compose_system_prompt(base_prompt, timezone, has_mcp_tools, has_web_search)
+
 
+# Keyed on the base prompt too, so a refreshed S3 prompt naturally misses
+@lru_cache(maxsize=64)
+def _compose_system_prompt(base_prompt: str, timezone: str, has_mcp_tools: bool, has_web_search: bool) -> str:
     language = TIMEZONE_TO_LANGUAGE.get(timezone)
     if language:
         prompt = (
@@ -411,13 +589,15 @@ async def execute_tool(tool_use: dict, context: dict) -> dict:
         return {
             "toolUseId": tool_use_id,
             "status": "success",
-            "content": [{"text": json.dumps(builtin_result)}],
+            "content": [{"text": orjson.dumps(builtin_result).decode()}],
         }
 
     # Try DuckDuckGo tool
     if duckduckgo_client and tool_name in duckduckgo_tool_names:
         try:
-            result = duckduckgo_client.call_tool_sync(name=tool_name, arguments=tool_input, tool_use_id=tool_use_id)
+            result = await asyncio.to_thread(
+                duckduckgo_client.call_tool_sync, name=tool_name, arguments=tool_input, tool_use_id=tool_use_id,
+            )
             logger.info(f"DuckDuckGo result type: {type(result)}")
 
             content = []
@@ -455,7 +635,9 @@ async def execute_tool(tool_use: dict, context: dict) -> dict:
         logger.info(f"Full tool_input: {tool_input}")
 
         try:
-            result = mcp_client.call_tool_sync(name=tool_name, arguments=tool_input, tool_use_id=tool_use_id)
+            result = await asyncio.to_thread(
+                mcp_client.call_tool_sync, name=tool_name, arguments=tool_input, tool_use_id=tool_use_id,
+            )
             logger.info(f"MCP result type: {type(result)}, result: {result}")
 
             # If result is already a dict with expected format, return it directly
@@ -507,64 +689,99 @@ async def ws_endpoint(websocket: WebSocket):
     logger.info("WebSocket connection accepted")
     config = get_config()
 
+    # Bound once per connection and fed ASGI messages directly, skipping the
+    # send_text/receive_text wrappers on every audio frame
+    send = websocket.send
+    receive = websocket.receive
+
+    async def send_json(payload: dict) -> None:
+        # orjson is much faster than the stdlib json used by WebSocket.send_json;
+        # frames stay text because the browser JSON.parse()s event.data directly
+        await send({"type": "websocket.send", "text": orjson.dumps(payload).decode()})
+
     try:
-        config_msg = await websocket.receive_json()
+        config_msg = orjson.loads(await websocket.receive_text())
         logger.info(
             f"Session started: voice={config_msg.get('voice')}, "
             f"timezone={config_msg.get('browser_time_zone')}, "
             f"project_id={config_msg.get('project_id')}, "
             f"user_id={config_msg.get('user_id')}"
         )
-    except (WebSocketDisconnect, json.JSONDecodeError) as e:
+    except (WebSocketDisconnect, orjson.JSONDecodeError) as e:
         logger.warning(f"Failed to receive config: {e}")
         return
 
-    # Create model based on user selection
-    model_type = config_msg.get("model_type", "nova_sonic")
-
-    # Create transcript saver for persisting voice messages
-    # Includes model_type in agent_id to distinguish sessions (e.g., voice_nova_sonic)
-    transcript_saver = TranscriptSaver(
-        bucket=config.session_storage_bucket_name,
-        user_id=config_msg.get("user_id", ""),
-        project_id=config_msg.get("project_id", ""),
-        session_id=config_msg.get("session_id", ""),
-        model_type=model_type,
-    )
-    if transcript_saver.enabled:
-        logger.info(f"Transcript saving enabled for session {config_msg.get('session_id')} ({transcript_saver.agent_id})")
-    api_key = config_msg.get("api_key")
-    voice = config_msg.get("voice", "tiffany")
+    user_timezone = config_msg.get("browser_time_zone", "UTC")
+    custom_prompt = config_msg.get("system_prompt")
+
+    # build_system_prompt may hit S3; run it in a thread while the transcript
+    # saver and model are set up, instead of serially before model.start()
+    prompt_task = None
+    if not custom_prompt:
+        prompt_task = asyncio.create_task(
+            asyncio.to_thread(
+                build_system_prompt,
+                user_timezone,
+                has_mcp_tools=len(mcp_tools) > 0,
+                has_web_search=len(duckduckgo_tools) > 0,
+            )
+        )
 
+    # The prompt task must not outlive a failed setup: cancel it, or consume its result
+    # if it already finished, so an exception from it is never left unretrieved
     try:
-        model = create_bidi_model(
+        # Create model based on user selection
+        model_type = config_msg.get("model_type", "nova_sonic")
+
+        # Create transcript saver for persisting voice messages
+        # Includes model_type in agent_id to distinguish sessions (e.g., voice_nova_sonic)
+        # S3SessionManager reads/creates the session object on init, so off the loop too
+        transcript_saver = await asyncio.to_thread(
+            TranscriptSaver,
+            bucket=config.session_storage_bucket_name,
+            user_id=config_msg.get("user_id", ""),
+            project_id=config_msg.get("project_id", ""),
+            session_id=config_msg.get("session_id", ""),
             model_type=model_type,
-            api_key=api_key,
-            voice=voice,
         )
-        logger.info(f"Created {model_type} model")
-    except ValueError as e:
-        logger.error(f"Failed to create model: {e}")
-        await websocket.close(code=1011, reason=str(e))
-        return
+        if transcript_saver.enabled:
+            logger.info(
+                f"Transcript saving enabled for session {config_msg.get('session_id')} ({transcript_saver.agent_id})"
+            )
+        api_key = config_msg.get("api_key")
+        voice = config_msg.get("voice", "tiffany")
 
-    user_timezone = config_msg.get("browser_time_zone", "UTC")
+        try:
+            model = create_bidi_model(
+                model_type=model_type,
+                api_key=api_key,
+                voice=voice,
+            )
+            logger.info(f"Created {model_type} model")
+        except ValueError as e:
+            logger.error(f"Failed to create model: {e}")
+            await websocket.close(code=1011, reason=str(e))
+            return
 
-    # Combine builtin tools with DuckDuckGo and MCP tools
-    all_tools = get_tools() + duckduckgo_tools + mcp_tools
-    has_mcp = len(mcp_tools) > 0
+        # Combine builtin tools with DuckDuckGo and MCP tools
+        all_tools = [*get_tools(), *duckduckgo_tools, *mcp_tools]
 
-    try:
-        custom_prompt = config_msg.get("system_prompt")
-        has_ddg = len(duckduckgo_tools) > 0
-        system_prompt = custom_prompt or build_system_prompt(user_timezone, has_mcp_tools=has_mcp, has_web_search=has_ddg)
-        logger.info(f"Starting model with {len(all_tools)} tools: {[t['name'] for t in all_tools]}")
-        await model.start(system_prompt=system_prompt, tools=all_tools)
-        logger.info("voice model started successfully")
-    except Exception:
-        logger.exception("Failed to start voice model")
-        await websocket.close(code=1011, reason="Failed to start model")
-        return
+        try:
+            system_prompt = custom_prompt or await prompt_task
+            logger.info(f"Starting model with {len(all_tools)} tools: {[t['name'] for t in all_tools]}")
+            await model.start(system_prompt=system_prompt, tools=all_tools)
+            logger.info("voice model started successfully")
+        except Exception:
+            logger.exception("Failed to start voice model")
+            await websocket.close(code=1011, reason="Failed to start model")
+            return
+    finally:
+        if prompt_task is not None and not prompt_task.cancel() and not prompt_task.cancelled():
+            prompt_task.exception()
+
+    # In-flight tool executions; bounded so a burst of tool calls can't swamp the model
+    tool_tasks: set[asyncio.Task] = set()
+    tool_semaphore = asyncio.Semaphore(MAX_CONCURRENT_TOOLS)
 
     # Tool context for parameter injection
     tool_context = {
@@ -577,29 +794,39 @@ async def ws_endpoint(websocket: WebSocket):
     async def browser_to_bedrock():
         """Forward messages from browser WebSocket to voice model."""
         msg_count = 0
+        # Sampled per-frame logging: level checked once, bitmask instead of modulo
+        audio_debug = logger.isEnabledFor(logging.DEBUG)
         try:
-            async for msg in websocket.iter_json():
+            while True:
+                message = await receive()
+                if message["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(message.get("code", 1000))
                 msg_count += 1
-                msg_type = msg.get("type")
-                if msg_type == "text":
-                    logger.info(f"[b2b] Text message #{msg_count}")
-                    transcript_saver.save_transcript("user", msg["text"])
-                    await model.send(BidiTextInputEvent(text=msg["text"]))
-                elif msg_type == "audio":
-                    if msg_count <= 5 or msg_count % 100 == 0:
-                        logger.debug(f"[b2b] Audio chunk #{msg_count}")
+                pcm = message.get("bytes")
+                if pcm is not None:
+                    # Binary frames carry raw 16kHz mono PCM from the browser,
+                    # saving the base64 + JSON round-trip on every chunk
+                    if audio_debug and (msg_count <= 5 or (msg_count & 127) == 0):
+                        logger.debug("[b2b] Audio chunk #%d", msg_count)
                     await model.send(
                         BidiAudioInputEvent(
-                            audio=msg["audio"],
+                            audio=base64.b64encode(pcm).decode(),
                             format="pcm",
                             sample_rate=16000,
                             channels=1,
                         )
                     )
+                    continue
+                msg = orjson.loads(message["text"])
+                msg_type = msg.get("type")
+                if msg_type == "text":
+                    logger.info(f"[b2b] Text message #{msg_count}")
+                    transcript_saver.save_transcript("user", msg["text"])
+                    await model.send(BidiTextInputEvent(text=msg["text"]))
                 elif msg_type == "ping":
                     # Keep-alive ping from browser, respond with pong
                     logger.debug(f"[b2b] Ping received, sending pong (msg #{msg_count})")
-                    await websocket.send_json({"type": "pong"})
+                    await send_json({"type": "pong"})
                 elif msg_type == "stop":
                     logger.info(f"[b2b] Stop received after {msg_count} messages")
                     break
@@ -609,187 +836,232 @@ async def ws_endpoint(websocket: WebSocket):
 
     async def bedrock_to_browser():
         """Forward events from voice model to browser WebSocket."""
+        # Dedupe repeated tool use events; bounded so multi-hour sessions stay flat
         processed_tool_use_ids: set[str] = set()
+        processed_tool_use_order: deque[str] = deque(maxlen=MAX_TRACKED_TOOL_USE_IDS)
         event_count = 0
+        batcher = OutboundBatcher(send_json)
+
+        async def handle_audio(event: BidiAudioStreamEvent) -> None:
+            # =============================================================
+            # Audio Chunking for AgentCore Compatibility
+            # =============================================================
+            #
+            # Problem:
+            # AWS Bedrock AgentCore WebSocket proxy has a 32KB message frame limit.
+            # OpenAI/Gemini Realtime APIs send variable-size audio chunks,
+            # sometimes exceeding 40KB per chunk.
+            # Exceeding the 32KB limit causes AgentCore to immediately terminate
+            # the WebSocket connection.
+            #
+            # Solution:
+            # Split large audio data into smaller chunks under 24KB.
+            #
+            # Why 24KB?
+            # - AgentCore limit: 32KB (32,768 bytes)
+            # - Audio is sent as a binary frame: 4-byte sample rate header
+            #   followed by raw 16-bit PCM (no base64/JSON overhead)
+            # - Safety margin: 24KB + 4 bytes << 32KB limit
+            # - 24000 is even, so every chunk holds whole 16-bit samples
+            #
+            # Notes:
+            # - Nova Sonic is Bedrock-native and optimized for small chunks
+            # - OpenAI/Gemini are external APIs with irregular chunk sizes
+            # - Browser-side AudioPlayback automatically queues and plays
+            #   sequential chunks seamlessly
+            # =============================================================
+            MAX_AUDIO_CHUNK_SIZE = 24000  # 24KB (considering AgentCore 32KB limit)
+            # The model hands us base64; decode once (in C) instead of shipping
+            # 33% larger text for the browser to atob() again
+            pcm = base64.b64decode(event.audio or "")
+            header = AUDIO_FRAME_HEADER.pack(event.sample_rate)
+
+            # Audio bypasses batching; flush queued events first to keep ordering
+            await batcher.flush()
+            # Split into chunks (a single iteration for typical small audio);
+            # browser's AudioPlayback queues and plays them sequentially
+            for i in range(0, len(pcm), MAX_AUDIO_CHUNK_SIZE):
+                await send({"type": "websocket.send", "bytes": header + pcm[i:i + MAX_AUDIO_CHUNK_SIZE]})
+
+        async def handle_transcript(event: BidiTranscriptStreamEvent) -> None:
+            preview = event.text[:50] if event.text else "(empty)"
+            logger.info(f"Transcript: role={event.role}, is_final={event.is_final}, text={preview}...")
+            await batcher.put(
+                {
+                    "type": "transcript",
+                    "text": event.text,
+                    "role": event.role,
+                    "is_final": event.is_final,
+                }
+            )
+            # Model-specific save logic (mirrors frontend display logic):
+            # - OpenAI: is_final=true only
+            # - Gemini: is_final=false only (is_final=true is empty/duplicate)
+            # - Nova Sonic: is_final=false only
+            should_save = event.text.strip() and (
+                (model_type == "openai" and event.is_final)
+                or (model_type != "openai" and not event.is_final)
+            )
+            if should_save:
+                transcript_saver.save_transcript(event.role, event.text)
 
-        try:
-            logger.info("[b2b2] Starting model.receive() loop")
-            async for event in model.receive():
-                event_count += 1
-                if event_count <= 10 or event_count % 50 == 0:
-                    logger.info(f"Event #{event_count}: {type(event).__name__}")
-                if isinstance(event, BidiAudioStreamEvent):
-                    # =============================================================
-                    # Audio Chunking for AgentCore Compatibility
-                    # =============================================================
-                    #
-                    # Problem:
-                    # AWS Bedrock AgentCore WebSocket proxy has a 32KB message frame limit.
-                    # OpenAI/Gemini Realtime APIs send variable-size audio chunks,
-                    # sometimes exceeding 40KB per chunk.
-                    # Exceeding the 32KB limit causes AgentCore to immediately terminate
-                    # the WebSocket connection.
-                    #
-                    # Solution:
-                    # Split large audio data into smaller chunks under 24KB.
-                    #
-                    # Why 24KB?
-                    # - AgentCore limit: 32KB (32,768 bytes)
-                    # - JSON overhead: {"type":"audio","audio":"...","sample_rate":24000}
-                    #   adds approximately 50-100 bytes
-                    # - Safety margin: 24KB + JSON overhead = 24-25KB << 32KB limit
-                    # - Audio data is already base64-encoded string from the model
-                    #
-                    # Notes:
-                    # - Nova Sonic is Bedrock-native and optimized for small chunks
-                    # - OpenAI/Gemini are external APIs with irregular chunk sizes
-                    # - Browser-side AudioPlayback automatically queues and plays
-                    #   sequential chunks seamlessly
-                    # =============================================================
-                    MAX_AUDIO_CHUNK_SIZE = 24000  # 24KB (considering AgentCore 32KB limit)
-                    audio_data = event.audio or ""
-                    sample_rate = event.sample_rate
-
-                    if len(audio_data) <= MAX_AUDIO_CHUNK_SIZE:
-                        # Small enough to send as-is
-                        await websocket.send_json({
-                            "type": "audio",
-                            "audio": audio_data,
-                            "sample_rate": sample_rate,
-                        })
-                    else:
-                        # Split large audio into chunks
-                        # Browser's AudioPlayback queues and plays them sequentially
-                        for i in range(0, len(audio_data), MAX_AUDIO_CHUNK_SIZE):
-                            chunk = audio_data[i:i + MAX_AUDIO_CHUNK_SIZE]
-                            await websocket.send_json({
-                                "type": "audio",
-                                "audio": chunk,
-                                "sample_rate": sample_rate,
-                            })
-                elif isinstance(event, BidiTranscriptStreamEvent):
-                    logger.info(f"Transcript: role={event.role}, is_final={event.is_final}, text={event.text[:50] if event.text else '(empty)'}...")
-                    await websocket.send_json(
+        async def run_tool(tool_use: dict, tool_name: str, tool_use_id: str) -> None:
+            # Runs as its own task so slow tools don't hold up audio forwarding
+            async with tool_semaphore:
+                try:
+                    tool_result = await execute_tool(tool_use, tool_context)
+                    logger.info(f"Tool result: {tool_name} -> {tool_result.get('status')}")
+                    await model.send(ToolResultEvent(tool_result))
+
+                    await batcher.put(
                         {
-                            "type": "transcript",
-                            "text": event.text,
-                            "role": event.role,
-                            "is_final": event.is_final,
+                            "type": "tool_result",
+                            "tool_name": tool_name,
+                            "tool_use_id": tool_use_id,
+                            "status": tool_result.get("status"),
                         }
                     )
-                    # Model-specific save logic (mirrors frontend display logic):
-                    # - OpenAI: is_final=true only
-                    # - Gemini: is_final=false only (is_final=true is empty/duplicate)
-                    # - Nova Sonic: is_final=false only
-                    should_save = event.text.strip() and (
-                        (model_type == "openai" and event.is_final)
-                        or (model_type != "openai" and not event.is_final)
-                    )
-                    if should_save:
-                        transcript_saver.save_transcript(event.role, event.text)
-                elif isinstance(event, ToolUseStreamEvent):
-                    # Handle tool use requests from the model
-                    tool_use = (
-                        getattr(event, "current_tool_use", None)
-                        or getattr(event, "tool_use", None)
-                        or (event.get("current_tool_use") if hasattr(event, "get") else None)
+                    transcript_saver.save_tool_result(
+                        tool_name, tool_use_id, tool_result.get("status", "success"),
                     )
-                    if tool_use:
-                        tool_use_id = tool_use.get("toolUseId")
-                        tool_input = tool_use.get("input")
-                        if (
-                            tool_use_id
-                            and tool_use_id not in processed_tool_use_ids
-                            and tool_input is not None
-                        ):
-                            processed_tool_use_ids.add(tool_use_id)
-                            tool_name = tool_use.get("name")
-                            logger.info(f"Tool use: {tool_name} (id: {tool_use_id})")
-
-                            await websocket.send_json(
-                                {
-                                    "type": "tool_use",
-                                    "tool_name": tool_name,
-                                    "tool_use_id": tool_use_id,
-                                }
-                            )
-
-                            try:
-                                tool_result = await execute_tool(tool_use, tool_context)
-                                logger.info(f"Tool result: {tool_name} -> {tool_result.get('status')}")
-                                await model.send(ToolResultEvent(tool_result))
-
-                                await websocket.send_json(
-                                    {
-                                        "type": "tool_result",
-                                        "tool_name": tool_name,
-                                        "tool_use_id": tool_use_id,
-                                        "status": tool_result.get("status"),
-                                    }
-                                )
-                                transcript_saver.save_tool_result(
-                                    tool_name, tool_use_id, tool_result.get("status", "success"),
-                                )
-                            except Exception as e:
-                                logger.exception(f"Tool execution error: {tool_name}")
-                                error_result = {
-                                    "toolUseId": tool_use_id,
-                                    "status": "error",
-                                    "content": [{"text": f"Tool execution error: {str(e)}"}],
-                                }
-                                try:
-                                    await model.send(ToolResultEvent(error_result))
-                                except Exception:
-                                    logger.exception("Failed to send error result")
-                                await websocket.send_json(
-                                    {
-                                        "type": "tool_result",
-                                        "tool_name": tool_name,
-                                        "tool_use_id": tool_use_id,
-                                        "status": "error",
-                                        "error": str(e),
-                                    }
-                                )
-                                transcript_saver.save_tool_result(
-                                    tool_name, tool_use_id, "error",
-                                )
-                elif isinstance(event, BidiConnectionStartEvent):
-                    await websocket.send_json(
+                except Exception as e:
+                    logger.exception(f"Tool execution error: {tool_name}")
+                    error_result = {
+                        "toolUseId": tool_use_id,
+                        "status": "error",
+                        "content": [{"text": f"Tool execution error: {str(e)}"}],
+                    }
+                    try:
+                        await model.send(ToolResultEvent(error_result))
+                    except Exception:
+                        logger.exception("Failed to send error result")
+                    await batcher.put(
                         {
-                            "type": "connection_start",
-                            "connection_id": event.connection_id,
+                            "type": "tool_result",
+                            "tool_name": tool_name,
+                            "tool_use_id": tool_use_id,
+                            "status": "error",
+                            "error": str(e),
                         }
                     )
-                elif isinstance(event, BidiResponseStartEvent):
-                    await websocket.send_json({"type": "response_start"})
-                elif isinstance(event, BidiResponseCompleteEvent):
-                    await websocket.send_json({"type": "response_complete"})
-                elif isinstance(event, BidiInterruptionEvent):
-                    await websocket.send_json(
-                        {
-                            "type": "interruption",
-                            "reason": event.reason,
-                        }
+                    transcript_saver.save_tool_result(
+                        tool_name, tool_use_id, "error",
                     )
-                elif isinstance(event, BidiErrorEvent):
-                    error_msg = getattr(event, 'message', None) or getattr(event, 'error', None) or str(event)
-                    logger.error(f"BidiErrorEvent received: {error_msg}")
-                    await websocket.send_json(
+
+        async def handle_tool_use(event: ToolUseStreamEvent) -> None:
+            # Handle tool use requests from the model
+            tool_use = get_tool_use(event)
+            if tool_use:
+                tool_use_id = tool_use.get("toolUseId")
+                tool_input = tool_use.get("input")
+                if (
+                    tool_use_id
+                    and tool_use_id not in processed_tool_use_ids
+                    and tool_input is not None
+                ):
+                    if len(processed_tool_use_order) == processed_tool_use_order.maxlen:
+                        processed_tool_use_ids.discard(processed_tool_use_order[0])
+                    processed_tool_use_order.append(tool_use_id)
+                    processed_tool_use_ids.add(tool_use_id)
+                    tool_name = tool_use.get("name")
+                    logger.info(f"Tool use: {tool_name} (id: {tool_use_id})")
+
+                    await batcher.put(
                         {
-                            "type": "error",
-                            "message": str(error_msg),
+                            "type": "tool_use",
+                            "tool_name": tool_name,
+                            "tool_use_id": tool_use_id,
                         }
                     )
+
+                    task = asyncio.create_task(run_tool(tool_use, tool_name, tool_use_id))
+                    tool_tasks.add(task)
+                    task.add_done_callback(tool_tasks.discard)
+
+        async def handle_connection_start(event: BidiConnectionStartEvent) -> None:
+            await batcher.put(
+                {
+                    "type": "connection_start",
+                    "connection_id": event.connection_id,
+                }
+            )
+
+        async def handle_response_start(event: BidiResponseStartEvent) -> None:
+            await batcher.put({"type": "response_start"})
+
+        async def handle_response_complete(event: BidiResponseCompleteEvent) -> None:
+            await batcher.put({"type": "response_complete"})
+
+        async def handle_interruption(event: BidiInterruptionEvent) -> None:
+            await batcher.put(
+                {
+                    "type": "interruption",
+                    "reason": event.reason,
+                }
+            )
+
+        async def handle_error(event: BidiErrorEvent) -> None:
+            error_msg = getattr(event, 'message', None) or getattr(event, 'error', None) or str(event)
+            logger.error(f"BidiErrorEvent received: {error_msg}")
+            await batcher.put(
+                {
+                    "type": "error",
+                    "message": str(error_msg),
+                }
+            )
+
+        # Exact-type dispatch table; subclasses are resolved once via isinstance
+        # (in the order below) and cached, unknown types are cached as None
+        handlers: dict[type, Callable[[Any], Awaitable[None]] | None] = {
+            BidiAudioStreamEvent: handle_audio,
+            BidiTranscriptStreamEvent: handle_transcript,
+            ToolUseStreamEvent: handle_tool_use,
+            BidiConnectionStartEvent: handle_connection_start,
+            BidiResponseStartEvent: handle_response_start,
+            BidiResponseCompleteEvent: handle_response_complete,
+            BidiInterruptionEvent: handle_interruption,
+            BidiErrorEvent: handle_error,
+        }
+
+        def resolve_handler(event_type: type) -> Callable[[Any], Awaitable[None]] | None:
+            handler = next(
+                (
+                    h
+                    for base, h in list(handlers.items())
+                    if h is not None and issubclass(event_type, base)
+                ),
+                None,
+            )
+            handlers[event_type] = handler
+            return handler
+
+        # Sampled per-event logging: level checked once, bitmask instead of modulo
+        event_info = logger.isEnabledFor(logging.INFO)
+        try:
+            logger.info("[b2b2] Starting model.receive() loop")
+            async for event in model.receive():
+                event_count += 1
+                event_type = type(event)
+                if event_info and (event_count <= 10 or (event_count & 63) == 0):
+                    logger.info("Event #%d: %s", event_count, event_type.__name__)
+                try:
+                    handler = handlers[event_type]
+                except KeyError:
+                    handler = resolve_handler(event_type)
+                if handler is not None:
+                    await handler(event)
                 else:
                     # Log unknown event types for debugging
-                    logger.debug(f"Unknown event type: {type(event).__name__}: {event}")
+                    logger.debug(f"Unknown event type: {event_type.__name__}: {event}")
             logger.info(f"[b2b2] model.receive() loop ended NORMALLY after {event_count} events")
+            await batcher.close()
         except WebSocketDisconnect:
             logger.info(f"WebSocket disconnected after {event_count} events")
         except BidiModelTimeoutError:
             logger.info("Voice chat session timed out due to inactivity")
             try:
-                await websocket.send_json({
+                await batcher.close()
+                await send_json({
                     "type": "timeout",
                     "reason": "Session timed out due to inactivity",
                 })
@@ -798,7 +1070,8 @@ async def ws_endpoint(websocket: WebSocket):
         except ConnectionClosedError as e:
             logger.warning(f"Model WebSocket closed unexpectedly after {event_count} events: {e}")
             try:
-                await websocket.send_json({
+                await batcher.close()
+                await send_json({
                     "type": "error",
                     "message": f"Model connection closed: {e}",
                 })
@@ -810,7 +1083,8 @@ async def ws_endpoint(websocket: WebSocket):
             if "Timed out waiting for input events" in error_str:
                 logger.info(f"Model input timeout after {event_count} events: {e}")
                 try:
-                    await websocket.send_json({
+                    await batcher.close()
+                    await send_json({
                         "type": "timeout",
                         "reason": "Session timed out due to inactivity",
                     })
@@ -821,21 +1095,38 @@ async def ws_endpoint(websocket: WebSocket):
                 logger.info(f"WebSocket closed while sending (after {event_count} events): {e}")
             else:
                 logger.exception(f"Error in bedrock_to_browser after {event_count} events")
+        finally:
+            # Cancellation or a disconnect skips close(); never leave a flush pending on a dead socket
+            batcher.cancel()
 
+    transcript_saver.start()
+
+    # Either direction ending ends the session: a gone browser must not leave
+    # the model streaming (and vice versa), so the other side is cancelled.
+    tasks = {
+        asyncio.create_task(browser_to_bedrock(), name="browser_to_bedrock"),
+        asyncio.create_task(bedrock_to_browser(), name="bedrock_to_browser"),
+    }
     try:
-        async with asyncio.TaskGroup() as tg:
-            tg.create_task(browser_to_bedrock())
-            tg.create_task(bedrock_to_browser())
-    except* WebSocketDisconnect:
-        logger.info("TaskGroup: WebSocketDisconnect")
-    except* Exception as eg:
-        for exc in eg.exceptions:
-            logger.error(f"TaskGroup exception: {type(exc).__name__}: {exc}")
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for task in done:
+            exc = task.exception()
+            if isinstance(exc, WebSocketDisconnect):
+                logger.info(f"{task.get_name()}: WebSocketDisconnect")
+            elif exc is not None:
+                logger.error(f"{task.get_name()} exception: {type(exc).__name__}: {exc}")
     finally:
+        for task in tasks | tool_tasks:
+            task.cancel()
+        await asyncio.gather(*tool_tasks, return_exceptions=True)
         logger.info("Stopping model...")
         try:
             await model.stop()
             logger.info("Model stopped successfully")
         except Exception as e:
             logger.error(f"Error stopping model: {e}")
+        await transcript_saver.close()
         logger.info("Session ended")
@@ -0,0 +1,34 @@
+from datetime import UTC
+from zoneinfo import ZoneInfo
+
+from agents.bidi_agent import _get_tz, get_date_and_time
+
+
+class TestGetTz:
+    def test_canonical_name(self):
+        assert _get_tz("Asia/Seoul") == (ZoneInfo("Asia/Seoul"), "Asia/Seoul")
+
+    def test_case_insensitive(self):
+        assert _get_tz("asia/seoul") == (ZoneInfo("Asia/Seoul"), "Asia/Seoul")
+        assert _get_tz("AMERICA/NEW_YORK") == (ZoneInfo("America/New_York"), "America/New_York")
+
+    def test_unknown_falls_back_to_utc(self):
+        assert _get_tz("Mars/Olympus_Mons") == (UTC, "UTC")
+
+    def test_malformed_key_falls_back_to_utc(self):
+        assert _get_tz("../etc/passwd") == (UTC, "UTC")
+
+
+class TestGetDateAndTime:
+    def test_uses_context_timezone(self):
+        result = get_date_and_time({}, {"timezone": "asia/tokyo"})
+        assert result["timezone"] == "Asia/Tokyo"
+
+    def test_tool_input_overrides_context(self):
+        result = get_date_and_time({"timezone": "Europe/Paris"}, {"timezone": "Asia/Tokyo"})
+        assert result["timezone"] == "Europe/Paris"
+
+    def test_defaults_to_utc(self):
+        result = get_date_and_time({}, {})
+        assert result["timezone"] == "UTC"
+        assert result["formattedTime"].endswith(("AM", "PM"))
@@ -0,0 +1,205 @@
+import asyncio
+import time
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from main import AUDIO_FRAME_HEADER, OutboundBatcher, TranscriptSaver, _utc_now_iso, get_tool_use
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestAudioFrameHeader:
+    def test_little_endian_sample_rate(self):
+        # The browser reads it with DataView.getUint32(0, true)
+        assert AUDIO_FRAME_HEADER.size == 4
+        assert AUDIO_FRAME_HEADER.pack(16000) == b"\x80\x3e\x00\x00"
+        assert AUDIO_FRAME_HEADER.pack(24000) == (24000).to_bytes(4, "little")
+
+    def test_frame_round_trip(self):
+        pcm = b"\x01\x02\x03\x04"
+        frame = AUDIO_FRAME_HEADER.pack(24000) + pcm
+
+        (sample_rate,) = AUDIO_FRAME_HEADER.unpack_from(frame)
+        assert sample_rate == 24000
+        assert frame[AUDIO_FRAME_HEADER.size :] == pcm
+
+
+class TestUtcNowIso:
+    def test_matches_isoformat(self):
+        before = datetime.now(UTC)
+        value = _utc_now_iso()
+        after = datetime.now(UTC)
+
+        parsed = datetime.fromisoformat(value)
+        assert before <= parsed <= after
+        assert value == parsed.isoformat()
+
+    @patch("main.time.time_ns")
+    def test_reuses_prefix_within_second(self, mock_time_ns):
+        mock_time_ns.return_value = 1_700_000_000_000_001_000
+        assert _utc_now_iso() == "2023-11-14T22:13:20.000001+00:00"
+
+        mock_time_ns.return_value = 1_700_000_000_999_999_000
+        assert _utc_now_iso() == "2023-11-14T22:13:20.999999+00:00"
+
+        mock_time_ns.return_value = 1_700_000_001_000_000_000
+        assert _utc_now_iso() == "2023-11-14T22:13:21.000000+00:00"
+
+
+class TestGetToolUse:
+    def test_attribute(self):
+        event = SimpleNamespace(current_tool_use={"name": "search"})
+        assert get_tool_use(event) == {"name": "search"}
+
+    def test_dict_event(self):
+        assert get_tool_use({"current_tool_use": {"name": "search"}}) == {"name": "search"}
+
+    def test_no_payload(self):
+        assert get_tool_use(object()) is None
+
+
+class TestOutboundBatcher:
+    @staticmethod
+    def _batcher() -> tuple[OutboundBatcher, list[dict]]:
+        sent: list[dict] = []
+
+        async def send(payload: dict) -> None:
+            sent.append(payload)
+
+        return OutboundBatcher(send), sent
+
+    @staticmethod
+    async def _wait_window() -> None:
+        await asyncio.sleep(OutboundBatcher.BATCH_WINDOW_SECONDS * 5)
+
+    def test_single_event_sent_as_is(self):
+        async def run():
+            batcher, sent = self._batcher()
+            await batcher.put({"type": "a"})
+            await self._wait_window()
+            return sent
+
+        assert _run(run()) == [{"type": "a"}]
+
+    def test_events_within_window_are_batched(self):
+        async def run():
+            batcher, sent = self._batcher()
+            await batcher.put({"type": "a"})
+            await batcher.put({"type": "b"})
+            await self._wait_window()
+            return sent
+
+        assert _run(run()) == [{"type": "batch", "items": [{"type": "a"}, {"type": "b"}]}]
+
+    def test_flushes_at_max_items(self):
+        async def run():
+            batcher, sent = self._batcher()
+            for i in range(OutboundBatcher.MAX_BATCH_ITEMS):
+                await batcher.put({"i": i})
+            flushed = list(sent)
+            batcher.cancel()
+            return flushed
+
+        flushed = _run(run())
+        assert len(flushed) == 1
+        assert flushed[0]["items"] == [{"i": i} for i in range(OutboundBatcher.MAX_BATCH_ITEMS)]
+
+    def test_cancel_drops_scheduled_flush(self):
+        async def run():
+            batcher, sent = self._batcher()
+            await batcher.put({"type": "a"})
+            batcher.cancel()
+            await self._wait_window()
+            return sent
+
+        assert _run(run()) == []
+
+    def test_close_flushes_pending(self):
+        async def run():
+            batcher, sent = self._batcher()
+            await batcher.put({"type": "a"})
+            await batcher.close()
+            return sent
+
+        assert _run(run()) == [{"type": "a"}]
+
+
+@patch("main.S3SessionManager")
+class TestTranscriptSaver:
+    def test_disabled_without_ids(self, mock_manager):
+        saver = TranscriptSaver(bucket="bucket", user_id="", project_id="p", session_id="s")
+
+        async def run():
+            saver.start()
+            saver.save_transcript("user", "hello")
+            await saver.close()
+
+        _run(run())
+        assert saver.enabled is False
+        mock_manager.assert_not_called()
+
+    def test_messages_written_in_order(self, mock_manager):
+        written = []
+
+        def create_message(session_id, agent_id, session_message):
+            # Earlier messages take longer; the single writer must still keep order
+            time.sleep(0.01 * (3 - session_message.message_id))
+            written.append((session_id, agent_id, session_message.message_id, session_message.message))
+
+        mock_manager.return_value.create_message.side_effect = create_message
+        saver = TranscriptSaver(bucket="bucket", user_id="u", project_id="p", session_id="s", model_type="gemini")
+
+        async def run():
+            saver.start()
+            saver.save_transcript("user", "hi")
+            saver.save_transcript("assistant", "hello")
+            saver.save_tool_result("search", "t1", "success")
+            await saver.close()
+
+        _run(run())
+
+        assert mock_manager.call_args.kwargs["prefix"] == "sessions/u/p"
+        assert [(sid, aid, idx) for sid, aid, idx, _ in written] == [
+            ("s", "voice_gemini", 0),
+            ("s", "voice_gemini", 1),
+            ("s", "voice_gemini", 2),
+        ]
+        assert written[0][3] == {"role": "user", "content": [{"text": "hi"}]}
+        assert written[2][3] == {
+            "role": "assistant",
+            "content": [{"toolResult": {"toolUseId": "t1", "status": "success", "content": [{"text": "search"}]}}],
+        }
+
+    def test_close_flushes_queued_messages(self, mock_manager):
+        saver = TranscriptSaver(bucket="bucket", user_id="u", project_id="p", session_id="s")
+
+        async def run():
+            saver.start()
+            for i in range(5):
+                saver.save_transcript("user", str(i))
+            await saver.close()
+
+        _run(run())
+        assert mock_manager.return_value.create_message.call_count == 5
+        assert saver.message_index == 5
+
+    def test_write_failure_does_not_stop_writer(self, mock_manager):
+        mock_manager.return_value.create_message.side_effect = [RuntimeError("boom"), None]
+        saver = TranscriptSaver(bucket="bucket", user_id="u", project_id="p", session_id="s")
+
+        async def run():
+            saver.start()
+            saver.save_transcript("user", "first")
+            saver.save_transcript("user", "second")
+            await saver.close()
+
+        _run(run())
+        assert mock_manager.return_value.create_message.call_count == 2
+
+    def test_close_without_start(self, mock_manager):
+        saver = TranscriptSaver(bucket="bucket", user_id="u", project_id="p", session_id="s")
+        _run(saver.close())
+        mock_manager.return_value.create_message.assert_not_called()
@@ -8,6 +8,17 @@ from botocore.awsrequest import AWSRequest
 from mcp.client.streamable_http import streamablehttp_client
 from strands.tools.mcp.mcp_client import MCPClient
 
+# SHA-256 of an empty payload. Most MCP control requests carry no body,
+# so the digest can be reused instead of hashed on every request.
+_EMPTY_SHA256_HEX = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+
+
+def _sha256_hex(content: bytes) -> str:
+    """Hash a request body through a memoryview so large payloads are never copied."""
+    digest = hashlib.sha256()
+    digest.update(memoryview(content))
+    return digest.hexdigest()
+
 
 class SigV4HTTPXAuth(httpx.Auth):
     """HTTPX Auth class that signs requests with AWS SigV4."""
@@ -19,10 +30,12 @@ class SigV4HTTPXAuth(httpx.Auth):
         self.signer = SigV4Auth(credentials, self.service, region)
 
     def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
-        headers = dict(request.headers)
+        # Mutate the httpx headers in place instead of copying them back and forth
+        headers = request.headers
 
         headers.pop("connection", None)
-        headers["x-amz-content-sha256"] = hashlib.sha256(request.content if request.content else b"").hexdigest()
+        content = request.content
+        headers["x-amz-content-sha256"] = _sha256_hex(content) if content else _EMPTY_SHA256_HEX
 
         aws_request = AWSRequest(
             method=request.method,
@@ -33,8 +46,10 @@ class SigV4HTTPXAuth(httpx.Auth):
 
         self.signer.add_auth(aws_request)
 
-        request.headers.clear()
-        request.headers.update(dict(aws_request.headers))
+        # Only the signing headers (Authorization, X-Amz-Date, ...) differ after add_auth
+        for key, value in aws_request.headers.items():
+            if headers.get(key) != value:
+                headers[key] = value
 
         yield request
 
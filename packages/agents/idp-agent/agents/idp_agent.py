@@ -1,19 +1,18 @@
+import threading
+from collections.abc import Iterator
 from contextlib import ExitStack, contextmanager
-from venv import create
+from functools import lru_cache
 
-import boto3
 from mcp import StdioServerParameters, stdio_client
 from strands import Agent
 from strands.hooks.registry import HookProvider
 from strands.models import BedrockModel
 from strands.session import S3SessionManager
 from strands.tools.mcp.mcp_client import MCPClient
-from strands_tools import calculator, current_time, file_read, generate_image, http_request, shell, use_llm
-from strands_tools.code_interpreter import AgentCoreCodeInterpreter
 
 from agentcore_mcp_client import AgentCoreGatewayMCPClient
 from config import get_config
-from helpers import get_project_language
+from helpers import MISSING, TTLCache, get_boto_session, get_project_language
 from prompts import build_system_prompt
 from tools.artifact import create_artifact_path_tool
 
@@ -42,14 +41,64 @@ def get_session_manager(
     )
 
 
+@lru_cache(maxsize=4)
+def _bedrock_model(model_id: str, region: str) -> BedrockModel:
+    """Shared BedrockModel so each invocation doesn't build a new bedrock-runtime client."""
+    return BedrockModel(
+        model_id=model_id,
+        region_name=region,
+    )
+
+
+@lru_cache(maxsize=1)
+def _static_tools() -> tuple:
+    """Session-independent tools, shared by every agent (treat as read-only).
+
+    strands_tools pulls in heavy dependencies, so it is imported on the first
+    request instead of at module load to keep container startup short.
+    """
+    from strands_tools import calculator, current_time, file_read, generate_image, http_request, shell, use_llm
+
+    return (calculator, current_time, generate_image, http_request, file_read, shell, use_llm)
+
+
+@lru_cache(maxsize=1)
+def _runtime_tools() -> tuple:
+    """Tools that only apply inside AgentCore Runtime, imported once on first use."""
+    if not get_config().is_agentcore:
+        return ()
+
+    from strands_tools import code_interpreter
+
+    return (code_interpreter,)
+
+
+# Model families known to accept cachePoint blocks in the Bedrock system prompt
+_PROMPT_CACHE_MODEL_MARKERS = ("anthropic", "claude", "amazon.nova")
+
+
+def _supports_prompt_cache(model_id: str) -> bool:
+    """Whether to place a cachePoint after the shared system prompt.
+
+    PROMPT_CACHE_ENABLED overrides the check either way. Otherwise only the
+    allow-listed families above get a cache point: models outside the list
+    silently run without prompt caching (and models that don't support it
+    would reject the block), so add new families here or enable the flag.
+    """
+    enabled = get_config().prompt_cache_enabled
+    if enabled is not None:
+        return enabled
+    model_id = model_id.lower()
+    return any(marker in model_id for marker in _PROMPT_CACHE_MODEL_MARKERS)
+
+
 def get_mcp_client():
     """Get MCP client for AgentCore Gateway."""
     config = get_config()
     if not config.mcp_gateway_url:
         return None
 
-    session = boto3.Session()
-    credentials = session.get_credentials()
+    credentials = get_boto_session().get_credentials()
 
     return AgentCoreGatewayMCPClient.with_iam_auth(
         gateway_url=config.mcp_gateway_url,
@@ -58,6 +107,46 @@ def get_mcp_client():
     )
 
 
+# Idle gateway MCP clients. MCPClient can be restarted after stop(), so a client
+# is checked out for one request and returned afterwards instead of being rebuilt
+# (signer, HTTP auth) per request; concurrent requests each get their own.
+_idle_mcp_clients: list[AgentCoreGatewayMCPClient] = []
+_idle_mcp_clients_lock = threading.Lock()
+
+
+@contextmanager
+def _pooled_mcp_client() -> Iterator[AgentCoreGatewayMCPClient | None]:
+    """Start a gateway MCP client from the idle pool for the duration of a request."""
+    with _idle_mcp_clients_lock:
+        client = _idle_mcp_clients.pop() if _idle_mcp_clients else None
+    if client is None:
+        client = get_mcp_client()
+    if client is None:
+        yield None
+        return
+
+    with client:
+        yield client
+
+    # Only clients that stopped cleanly are reused
+    with _idle_mcp_clients_lock:
+        _idle_mcp_clients.append(client)
+
+
+# Gateway tool inventory per pooled client. MCPAgentTool objects call back into
+# the client they were listed from, so the cache is keyed by that client instance
+# (valid again once it is restarted) rather than by gateway URL.
+_mcp_tools_cache = TTLCache(ttl=300, maxsize=32)
+
+
+def _list_mcp_tools(client: AgentCoreGatewayMCPClient) -> list:
+    tools = _mcp_tools_cache.get(client)
+    if tools is MISSING:
+        tools = client.list_tools_sync()
+        _mcp_tools_cache.set(client, tools)
+    return tools
+
+
 def get_duckduckgo_mcp_client():
     """Get MCP client for DuckDuckGo search server."""
 
@@ -89,11 +178,12 @@ def get_agent(
         Agent instance with session management configured
     """
     session_manager = get_session_manager(session_id, user_id=user_id, project_id=project_id)
-    mcp_client = get_mcp_client()
     duckduckgo_client = get_duckduckgo_mcp_client()
 
     config = get_config()
 
+    from strands_tools.code_interpreter import AgentCoreCodeInterpreter
+
     interpreter = AgentCoreCodeInterpreter(
         region=config.aws_region,
         session_name=session_id,
@@ -101,35 +191,22 @@ def get_agent(
     )
 
     tools = [
-        calculator,
-        current_time,
-        generate_image,
-        http_request,
-        file_read,
-        shell,
-        use_llm,
+        *_static_tools(),
         interpreter.code_interpreter,
         create_artifact_path_tool(user_id, project_id),
+        *_runtime_tools(),
     ]
 
-    config = get_config()
-    if config.is_agentcore:
-        from strands_tools import code_interpreter
-
-        tools.append(code_interpreter)
-
     language_code = get_project_language(project_id) if project_id else None
     system_prompt = build_system_prompt(
         project_id=project_id,
         user_id=user_id,
         agent_id=agent_id,
         language_code=language_code,
+        cache=_supports_prompt_cache(config.bedrock_model_id),
     )
 
-    bedrock_model = BedrockModel(
-        model_id=config.bedrock_model_id,
-        region_name=config.aws_region,
-    )
+    bedrock_model = _bedrock_model(config.bedrock_model_id, config.aws_region)
 
     hooks: list[HookProvider] = [
         ToolParameterEnforcerHook(user_id=user_id, project_id=project_id),
@@ -151,8 +228,8 @@ def get_agent(
             stack.enter_context(duckduckgo_client)
             tools.extend(duckduckgo_client.list_tools_sync())
 
+        mcp_client = stack.enter_context(_pooled_mcp_client())
         if mcp_client:
-            stack.enter_context(mcp_client)
-            tools.extend(mcp_client.list_tools_sync())
+            tools.extend(_list_mcp_tools(mcp_client))
 
         yield create_agent()
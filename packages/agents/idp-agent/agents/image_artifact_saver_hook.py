@@ -1,14 +1,39 @@
+import logging
 import re
+import secrets
+from io import BytesIO
 
-import boto3
-from nanoid import generate as nanoid_generate
+from boto3.s3.transfer import TransferConfig
 from strands.hooks.events import AfterToolCallEvent
 from strands.hooks.registry import HookProvider, HookRegistry
 
 from config import get_config
+from helpers import BOTO_CONFIG, get_boto_session
+
+logger = logging.getLogger(__name__)
+
+_FILENAME_STRIP = re.compile(r"[^\w\s]+")
+_TARGET_TOOLS = frozenset({"generate_image"})
+
+# Large images go through the managed transfer (multipart, parallel parts)
+_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+_TRANSFER_CONFIG = TransferConfig(multipart_threshold=_MULTIPART_THRESHOLD, max_concurrency=4, use_threads=True)
 
 _config = get_config()
-s3_client = boto3.client("s3", region_name=_config.aws_region)
+s3_client = get_boto_session().client("s3", region_name=_config.aws_region, config=BOTO_CONFIG)
+
+
+def _upload(bucket: str, key: str, body: bytes, content_type: str) -> None:
+    if len(body) < _MULTIPART_THRESHOLD:
+        s3_client.put_object(Bucket=bucket, Key=key, Body=body, ContentType=content_type)
+    else:
+        s3_client.upload_fileobj(
+            BytesIO(body),
+            bucket,
+            key,
+            ExtraArgs={"ContentType": content_type},
+            Config=_TRANSFER_CONFIG,
+        )
 
 
 class ImageArtifactSaverHook(HookProvider):
@@ -17,16 +42,14 @@ class ImageArtifactSaverHook(HookProvider):
     def __init__(self, user_id: str | None = None, project_id: str | None = None):
         self.user_id = user_id
         self.project_id = project_id
+        self._s3_prefix = f"{user_id}/{project_id}/artifacts/" if user_id and project_id else None
 
     def register_hooks(self, registry: HookRegistry, **kwargs) -> None:
         registry.add_callback(AfterToolCallEvent, self._save_image_artifact)
 
     def _save_image_artifact(self, event: AfterToolCallEvent) -> None:
-        if event.selected_tool is None:
-            return
-
-        tool_name = event.selected_tool.tool_name
-        if tool_name != "generate_image":
+        # Fires after every tool call; bail out before touching anything else
+        if event.selected_tool is None or event.selected_tool.tool_name not in _TARGET_TOOLS:
             return
 
         if event.exception or not event.result:
@@ -36,11 +59,12 @@ class ImageArtifactSaverHook(HookProvider):
         if result.get("status") != "success":
             return
 
-        if not self.user_id or not self.project_id:
+        s3_prefix = self._s3_prefix
+        if s3_prefix is None:
             return
 
-        config = get_config()
-        if not config.agent_storage_bucket_name:
+        bucket = _config.agent_storage_bucket_name
+        if not bucket:
             return
 
         # Extract image bytes from result content
@@ -61,27 +85,22 @@ class ImageArtifactSaverHook(HookProvider):
         prompt = event.tool_use.get("input", {}).get("prompt", "generated_image")
         filename = self._create_filename(prompt, image_format)
 
-        try:
-            content_type = f"image/{image_format}"
-            artifact_id = f"art_{nanoid_generate(size=21)}"
-            s3_key = f"{self.user_id}/{self.project_id}/artifacts/{artifact_id}/{filename}"
-
-            # Upload to S3
-            s3_client.put_object(
-                Bucket=config.agent_storage_bucket_name,
-                Key=s3_key,
-                Body=image_bytes,
-                ContentType=content_type,
-            )
+        content_type = f"image/{image_format}"
+        artifact_id = f"art_{secrets.token_urlsafe(16)}"
+        s3_key = f"{s3_prefix}{artifact_id}/{filename}"
 
-            # Append artifact info to result content
-            result["content"].append({"text": f"\n\n[artifact:{artifact_id}]({filename})"})
+        # The marker is only added once the object exists, so it never points at a missing artifact
+        try:
+            _upload(bucket, s3_key, image_bytes, content_type)
+        except Exception as e:
+            logger.error(f"Failed to save image artifact {s3_key}: {e}")
+            return
 
-        except Exception:
-            pass
+        # Append artifact info to result content
+        result["content"].append({"text": f"\n\n[artifact:{artifact_id}]({filename})"})
 
     @staticmethod
     def _create_filename(prompt: str, fmt: str) -> str:
-        words = re.sub(r"[^\w\s]", "", prompt).split()[:5]
+        words = _FILENAME_STRIP.sub("", prompt).split()[:5]
         name = "_".join(words) if words else "generated_image"
         return f"{name}.{fmt}"
@@ -15,6 +15,8 @@ class Config(BaseSettings):
     websocket_message_queue_url: str = ""
     bedrock_model_id: str = "global.anthropic.claude-opus-4-6-v1"
     code_interpreter_identifier: str = ""
+    # Force Bedrock prompt caching on/off; unset uses the model allow-list in idp_agent
+    prompt_cache_enabled: bool | None = None
 
     @property
     def is_agentcore(self) -> bool:
@@ -1,8 +1,56 @@
+import time
+from collections.abc import Hashable
+from functools import lru_cache
+from typing import Any
+
 import boto3
+from botocore.config import Config
 from pydantic import BaseModel
 
 from config import get_config
 
+# Shared by every boto3 client/resource in the agent: keep-alive connections and a
+# pool large enough for the artifact hook's back-to-back calls
+BOTO_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+
+
+@lru_cache(maxsize=1)
+def get_boto_session() -> boto3.Session:
+    """Process-wide boto3 session; its credentials refresh themselves on expiry."""
+    return boto3.Session()
+
+
+MISSING = object()
+
+
+class TTLCache:
+    """Small in-process cache whose entries expire ttl seconds after being set."""
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or MISSING if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry[0]:
+            return MISSING
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            # Drop the oldest insertion to stay bounded
+            self._entries.pop(next(iter(self._entries)), None)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
 
 class ProjectData(BaseModel):
     language: str = "en"
@@ -12,19 +60,32 @@ class ProjectItem(BaseModel):
     data: ProjectData
 
 
-def get_project_language(project_id: str) -> str | None:
-    """Get project language from DynamoDB."""
+@lru_cache(maxsize=1)
+def _backend_table():
+    """Backend DynamoDB table, created once and reused across calls."""
     config = get_config()
     if not config.backend_table_name:
         return None
 
-    dynamodb = boto3.resource("dynamodb", region_name=config.aws_region)
-    table = dynamodb.Table(config.backend_table_name)
+    dynamodb = get_boto_session().resource("dynamodb", region_name=config.aws_region, config=BOTO_CONFIG)
+    return dynamodb.Table(config.backend_table_name)
 
-    response = table.get_item(Key={"PK": f"PROJ#{project_id}", "SK": "META"})
-    item = response.get("Item")
-    if not item:
+
+_project_language_cache = TTLCache(ttl=60)
+
+
+def get_project_language(project_id: str) -> str | None:
+    """Get project language from DynamoDB, cached briefly per project."""
+    language = _project_language_cache.get(project_id)
+    if language is not MISSING:
+        return language
+
+    table = _backend_table()
+    if table is None:
         return None
 
-    project = ProjectItem.model_validate(item)
-    return project.data.language
+    response = table.get_item(Key={"PK": f"PROJ#{project_id}", "SK": "META"})
+    item = response.get("Item")
+    language = ProjectItem.model_validate(item).data.language if item else None
+    _project_language_cache.set(project_id, language)
+    return language
@@ -1,40 +1,43 @@
-import base64
+import asyncio
 import sys
+import time
 
 from bedrock_agentcore.runtime import BedrockAgentCoreApp
+from pybase64 import b64encode_as_string
 
 from agents import get_agent
 from config import get_config
 from models import InvokeRequest
 
 
+def _serialize_tool_result_item(item: dict) -> dict:
+    if "image" in item:
+        image = item["image"]
+        bytes_data = image.get("source", {}).get("bytes")
+        if isinstance(bytes_data, bytes):
+            return {
+                "type": "image",
+                "image": {
+                    "format": image.get("format", "jpeg"),
+                    "source": {"bytes": b64encode_as_string(bytes_data)},
+                },
+            }
+        return {"type": "image", "image": image}
+    if "text" in item:
+        return {"type": "text", "text": item["text"]}
+    return item
+
+
 def serialize_tool_result_content(content: list) -> list:
-    serialized = []
-    for item in content:
-        if "image" in item:
-            image = item["image"]
-            bytes_data = image.get("source", {}).get("bytes")
-            if isinstance(bytes_data, bytes):
-                serialized.append(
-                    {
-                        "type": "image",
-                        "image": {
-                            "format": image.get("format", "jpeg"),
-                            "source": {"bytes": base64.b64encode(bytes_data).decode("utf-8")},
-                        },
-                    }
-                )
-            else:
-                serialized.append({"type": "image", "image": image})
-        elif "text" in item:
-            serialized.append({"type": "text", "text": item["text"]})
-        else:
-            serialized.append(item)
-    return serialized
+    return [_serialize_tool_result_item(item) for item in content]
 
 
 app = BedrockAgentCoreApp()
 
+# Consecutive text deltas are coalesced before being yielded to the client
+TEXT_FLUSH_MAX_PARTS = 8
+TEXT_FLUSH_INTERVAL_SECONDS = 0.02
+
 config = get_config()
 if not config.session_storage_bucket_name:
     print("ERROR: SESSION_STORAGE_BUCKET_NAME environment variable is required")
@@ -44,50 +47,139 @@ if not config.mcp_gateway_url:
     sys.exit(1)
 
 
-def filter_stream_event(event: dict) -> list[dict]:
-    if "data" in event:
-        return [{"type": "text", "content": event["data"]}]
-
-    if "current_tool_use" in event:
-        tool_use = event["current_tool_use"]
-        if tool_use.get("name"):
-            result = {
-                "type": "tool_use",
-                "name": tool_use["name"],
-                "tool_use_id": tool_use.get("toolUseId", ""),
-            }
-            if tool_use.get("input"):
-                result["input"] = tool_use["input"]
-            return [result]
-
-    if "message" in event and event["message"].get("role") == "user":
-        results = []
-        content = event["message"].get("content", [])
-        for block in content:
-            if "toolResult" in block:
-                tool_result = block["toolResult"]
-                raw_content = tool_result.get("content", [])
-                serialized_content = serialize_tool_result_content(raw_content)
-                results.append(
-                    {
-                        "type": "tool_result",
-                        "tool_use_id": tool_result.get("toolUseId"),
-                        "content": serialized_content,
-                        "status": tool_result.get("status"),
-                    }
-                )
-        if results:
-            return results
-
-    if event.get("complete"):
-        return [{"type": "complete"}]
+def _text_event(event: dict) -> list[dict]:
+    return [{"type": "text", "content": event["data"]}]
+
+
+def _tool_use_event(event: dict) -> list[dict]:
+    tool_use = event["current_tool_use"]
+    if not tool_use.get("name"):
+        return []
+    result = {
+        "type": "tool_use",
+        "name": tool_use["name"],
+        "tool_use_id": tool_use.get("toolUseId", ""),
+    }
+    if tool_use.get("input"):
+        result["input"] = tool_use["input"]
+    return [result]
+
+
+def _tool_result_event(event: dict) -> list[dict]:
+    message = event["message"]
+    if message.get("role") != "user":
+        return []
+    results = []
+    for block in message.get("content", []):
+        if "toolResult" in block:
+            tool_result = block["toolResult"]
+            raw_content = tool_result.get("content", [])
+            serialized_content = serialize_tool_result_content(raw_content)
+            results.append(
+                {
+                    "type": "tool_result",
+                    "tool_use_id": tool_result.get("toolUseId"),
+                    "content": serialized_content,
+                    "status": tool_result.get("status"),
+                }
+            )
+    return results
+
+
+def _complete_event(event: dict) -> list[dict]:
+    return [{"type": "complete"}] if event["complete"] else []
+
+
+# Checked in priority order; a handler returning [] falls through to the next matching key
+_STREAM_EVENT_HANDLERS = (
+    ("data", _text_event),
+    ("current_tool_use", _tool_use_event),
+    ("message", _tool_result_event),
+    ("complete", _complete_event),
+)
+_STREAM_EVENT_KEYS = frozenset(key for key, _ in _STREAM_EVENT_HANDLERS)
+
 
+def filter_stream_event(event: dict) -> list[dict]:
+    # Most lifecycle/delta events carry none of these keys
+    if _STREAM_EVENT_KEYS.isdisjoint(event):
+        return []
+
+    for key, handler in _STREAM_EVENT_HANDLERS:
+        if key in event:
+            filtered = handler(event)
+            if filtered:
+                return filtered
     return []
 
 
+_STREAM_END = object()
+
+
+async def _pump_filtered(stream, queue: asyncio.Queue) -> None:
+    try:
+        async for event in stream:
+            for filtered in filter_stream_event(event):
+                await queue.put(filtered)
+    except Exception as e:
+        await queue.put(e)
+    else:
+        await queue.put(_STREAM_END)
+
+
+async def _coalesce_text(stream):
+    """Yield filtered stream events, joining runs of text deltas.
+
+    Buffered text is flushed after TEXT_FLUSH_MAX_PARTS deltas, before any other event, and
+    TEXT_FLUSH_INTERVAL_SECONDS after its first delta even if the stream has gone quiet (e.g. a
+    slow tool call). The stream is drained by a single task so it keeps one context throughout.
+    """
+    # Bounded so a slow client still applies backpressure to the agent
+    queue: asyncio.Queue = asyncio.Queue(maxsize=TEXT_FLUSH_MAX_PARTS)
+    pump = asyncio.create_task(_pump_filtered(stream, queue))
+    text_buf: list[str] = []
+    deadline = 0.0
+    try:
+        while True:
+            if text_buf:
+                try:
+                    item = await asyncio.wait_for(queue.get(), deadline - time.monotonic())
+                except TimeoutError:
+                    yield {"type": "text", "content": "".join(text_buf)}
+                    text_buf.clear()
+                    continue
+            else:
+                item = await queue.get()
+
+            if item is _STREAM_END:
+                break
+            if isinstance(item, Exception):
+                raise item
+
+            if item["type"] == "text":
+                if not text_buf:
+                    deadline = time.monotonic() + TEXT_FLUSH_INTERVAL_SECONDS
+                text_buf.append(item["content"])
+                if len(text_buf) >= TEXT_FLUSH_MAX_PARTS:
+                    yield {"type": "text", "content": "".join(text_buf)}
+                    text_buf.clear()
+                continue
+
+            if text_buf:
+                yield {"type": "text", "content": "".join(text_buf)}
+                text_buf.clear()
+            yield item
+
+        if text_buf:
+            yield {"type": "text", "content": "".join(text_buf)}
+    finally:
+        pump.cancel()
+
+
 @app.entrypoint
 async def invoke(request: dict):
-    req = InvokeRequest(**request)
+    # Validation base64-decodes every attachment; keep multi-MB uploads off the event loop
+    req = await asyncio.to_thread(InvokeRequest.model_validate, request)
 
     with get_agent(
         session_id=req.session_id,
@@ -96,10 +188,8 @@ async def invoke(request: dict):
         agent_id=req.agent_id,
     ) as agent:
         content = [block.to_strands() for block in req.prompt]
-        stream = agent.stream_async(content)
-        async for event in stream:
-            for filtered in filter_stream_event(event):
-                yield filtered
+        async for event in _coalesce_text(agent.stream_async(content)):
+            yield event
 
 
 if __name__ == "__main__":
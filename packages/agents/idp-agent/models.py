@@ -1,14 +1,28 @@
-import base64
+import os
 import re
+from typing import Annotated
 
-from nanoid import generate
-from pydantic import BaseModel
+from pybase64 import b64decode
+from pydantic import BaseModel, BeforeValidator, Field
 from strands.types.content import ContentBlock as StrandsContentBlock
 from strands.types.media import DocumentContent as StrandsDocumentContent
 from strands.types.media import ImageContent as StrandsImageContent
 
 # Alphanumeric characters only for Bedrock compatibility
-NANOID_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+ID_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+# Bytes at or above this are rejected so that byte % 62 stays uniform
+_ID_BYTE_LIMIT = 256 - 256 % len(ID_ALPHABET)
+
+# Runs of disallowed characters and hyphens collapse to a single "-" in one pass
+_DISALLOWED_RUN = re.compile(r"[^a-zA-Z0-9\s()\[\]]+")
+
+
+def _short_id(size: int = 8) -> str:
+    """Random alphanumeric id drawn from a single urandom read (rarely two)."""
+    chars: list[str] = []
+    while len(chars) < size:
+        chars.extend(ID_ALPHABET[b % len(ID_ALPHABET)] for b in os.urandom(size * 2) if b < _ID_BYTE_LIMIT)
+    return "".join(chars[:size])
 
 
 def sanitize_document_name(name: str) -> str:
@@ -17,17 +31,25 @@ def sanitize_document_name(name: str) -> str:
     Bedrock DocumentBlock name only allows: alphanumeric, spaces, hyphens, parentheses, brackets.
     Pattern: ^[a-zA-Z0-9\\s\\-\\(\\)\\[\\]]+$
 
-    A unique nanoid suffix is appended to ensure uniqueness across session history.
+    A unique random suffix is appended to ensure uniqueness across session history.
     """
     stem = name.rsplit(".", 1)[0] if "." in name else name
-    sanitized = re.sub(r"[^a-zA-Z0-9\s\-\(\)\[\]]", "-", stem)[:180]
-    sanitized = re.sub(r"-+", "-", sanitized).strip("-") or "doc"
-    unique_id = generate(NANOID_ALPHABET, 8)
+    sanitized = _DISALLOWED_RUN.sub("-", stem[:180]).strip("-") or "doc"
+    unique_id = _short_id()
     return f"{sanitized}-{unique_id}"
 
 
+def _decode_base64(value: object) -> object:
+    return b64decode(value) if isinstance(value, str) else value
+
+
+# Decoded once during validation, so the raw bytes can be handed to Strands as-is
+Base64Payload = Annotated[bytes, BeforeValidator(_decode_base64)]
+
+
 class ContentSource(BaseModel):
-    base64: str
+    # Sent as base64 text under the "base64" key, held as the decoded bytes
+    data: Base64Payload = Field(alias="base64")
 
 
 class ImageContent(BaseModel):
@@ -54,7 +76,7 @@ class ContentBlock(BaseModel):
             return StrandsContentBlock(
                 image=StrandsImageContent(
                     format=self.image.format,  # type: ignore[typeddict-item]
-                    source={"bytes": base64.b64decode(self.image.source.base64)},
+                    source={"bytes": self.image.source.data},
                 )
             )
         if self.document:
@@ -62,7 +84,7 @@ class ContentBlock(BaseModel):
                 document=StrandsDocumentContent(
                     format=self.document.format,  # type: ignore[typeddict-item]
                     name=sanitize_document_name(self.document.name),
-                    source={"bytes": base64.b64decode(self.document.source.base64)},
+                    source={"bytes": self.document.source.data},
                 )
             )
         return StrandsContentBlock(text="")
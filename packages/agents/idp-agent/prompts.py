@@ -1,13 +1,27 @@
-import json
 import logging
+from functools import lru_cache
 
-import boto3
+import orjson
+from strands.types.content import SystemContentBlock
 
 from config import get_config
+from helpers import BOTO_CONFIG, MISSING, TTLCache, get_boto_session
 from skills import build_skills_registry, load_skill_content
 
 logger = logging.getLogger(__name__)
 
+# Prompts are edited rarely; serve them from memory for a short while instead of
+# an S3 GET on every agent turn. Failed fetches are not cached.
+PROMPT_CACHE_TTL_SECONDS = 60
+_prompt_cache = TTLCache(ttl=PROMPT_CACHE_TTL_SECONDS)
+
+
+@lru_cache(maxsize=1)
+def _s3_client():
+    """Shared S3 client; building one loads the service model and walks the credential chain."""
+    return get_boto_session().client("s3", config=BOTO_CONFIG)
+
+
 DEFAULT_SYSTEM_PROMPT = """You are an Intelligent Document Processing (IDP) assistant.
 You help users find, understand, and analyze information from their uploaded documents.
 You are professional, concise, and always ground your answers in evidence from the user's documents.
@@ -120,47 +134,71 @@ the full path is `/skills/docx/scripts/validate.py`.
 </skills_system>
 """
 
+CUSTOM_INSTRUCTIONS_PROMPT = """
+
+## Custom Instructions
+{custom_prompt}
+"""
+
+LANGUAGE_PROMPT = """
+You MUST respond in the language corresponding to code: {language_code}.
+This applies to all explanatory text only. Keep tool calls, code, document titles, and direct quotations in their original language.
+"""
+
+
+@lru_cache(maxsize=8)
+def _compose_static_prompt(base_prompt: str) -> str:
+    """Base prompt plus skills registry, built once per base prompt version.
+
+    Skills ship with the image, so the registry scan only has to run once and
+    the shared prefix stays byte-identical across requests.
+    """
+    skills_registry = build_skills_registry()
+    if not skills_registry:
+        return base_prompt
+    return base_prompt + SKILLS_SYSTEM_PROMPT.replace("{{SKILLS_REGISTRY}}", skills_registry)
+
 
 def build_system_prompt(
     project_id: str | None = None,
     user_id: str | None = None,
     agent_id: str | None = None,
     language_code: str | None = None,
-) -> str:
+    cache: bool = False,
+) -> list[SystemContentBlock]:
     """Build the complete system prompt with all components.
 
+    The shared part (base prompt and skills registry) comes first and the
+    per-agent/per-project instructions last, so the prefix is identical across
+    requests and can be served from the model's prompt cache.
+
     Args:
         project_id: Project ID for custom agent prompt
         user_id: User ID for custom agent prompt
         agent_id: Custom agent ID for prompt injection
         language_code: Language code for response language
+        cache: Insert a cache point after the shared prefix
 
     Returns:
-        Complete system prompt string
+        System prompt content blocks
     """
-    system_prompt = fetch_system_prompt() or DEFAULT_SYSTEM_PROMPT
-
-    skills_registry = build_skills_registry()
-    if skills_registry:
-        skills_prompt = SKILLS_SYSTEM_PROMPT.replace("{{SKILLS_REGISTRY}}", skills_registry)
-        system_prompt += skills_prompt
+    static_prompt = _compose_static_prompt(fetch_system_prompt() or DEFAULT_SYSTEM_PROMPT)
 
+    dynamic_parts = []
     if agent_id and user_id and project_id:
         custom_prompt = fetch_custom_agent_prompt(user_id, project_id, agent_id)
         if custom_prompt:
-            system_prompt += f"""
-
-## Custom Instructions
-{custom_prompt}
-"""
+            dynamic_parts.append(CUSTOM_INSTRUCTIONS_PROMPT.format(custom_prompt=custom_prompt))
 
     if language_code:
-        system_prompt += f"""
-You MUST respond in the language corresponding to code: {language_code}.
-This applies to all explanatory text only. Keep tool calls, code, document titles, and direct quotations in their original language.
-"""
+        dynamic_parts.append(LANGUAGE_PROMPT.format(language_code=language_code))
 
-    return system_prompt
+    blocks: list[SystemContentBlock] = [{"text": static_prompt}]
+    if cache:
+        blocks.append({"cachePoint": {"type": "default"}})
+    if dynamic_parts:
+        blocks.append({"text": "".join(dynamic_parts)})
+    return blocks
 
 
 def fetch_system_prompt() -> str | None:
@@ -169,19 +207,26 @@ def fetch_system_prompt() -> str | None:
     if not config.agent_storage_bucket_name:
         return None
 
-    s3 = boto3.client("s3")
     key = "__prompts/chat/system_prompt.txt"
+    prompt = _prompt_cache.get(key)
+    if prompt is not MISSING:
+        return prompt
+
+    s3 = _s3_client()
 
     try:
         response = s3.get_object(
             Bucket=config.agent_storage_bucket_name,
             Key=key,
         )
-        return response["Body"].read().decode("utf-8")
+        prompt = response["Body"].read().decode("utf-8")
     except Exception as e:
         logger.error(f"Failed to fetch system prompt: {e}")
         return None
 
+    _prompt_cache.set(key, prompt)
+    return prompt
+
 
 def fetch_custom_agent_prompt(user_id: str, project_id: str, agent_id: str) -> str | None:
     """Fetch custom agent prompt from S3."""
@@ -189,19 +234,26 @@ def fetch_custom_agent_prompt(user_id: str, project_id: str, agent_id: str) -> s
     if not config.agent_storage_bucket_name:
         return None
 
-    s3 = boto3.client("s3")
     key = f"{user_id}/{project_id}/agents/{agent_id}.json"
+    prompt = _prompt_cache.get(key)
+    if prompt is not MISSING:
+        return prompt
+
+    s3 = _s3_client()
 
     try:
         response = s3.get_object(
             Bucket=config.agent_storage_bucket_name,
             Key=key,
         )
-        data = json.loads(response["Body"].read().decode("utf-8"))
-        return data.get("content")
+        data = orjson.loads(response["Body"].read())
+        prompt = data.get("content")
     except s3.exceptions.NoSuchKey:
         logger.warning(f"Agent not found: {agent_id}")
-        return None
+        prompt = None
     except Exception as e:
         logger.error(f"Failed to fetch agent prompt: {e}")
         return None
+
+    _prompt_cache.set(key, prompt)
+    return prompt
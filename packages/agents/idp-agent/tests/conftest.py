@@ -0,0 +1,7 @@
+"""Unit tests configuration module."""
+
+import os
+
+# main.py exits at import time without these
+os.environ.setdefault("SESSION_STORAGE_BUCKET_NAME", "test-session-bucket")
+os.environ.setdefault("MCP_GATEWAY_URL", "https://gateway.example.com/mcp")
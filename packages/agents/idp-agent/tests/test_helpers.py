@@ -0,0 +1,68 @@
+from unittest.mock import patch
+
+from helpers import MISSING, TTLCache
+
+
+class TestTTLCache:
+    def test_missing_key(self):
+        cache = TTLCache(ttl=60)
+        assert cache.get("absent") is MISSING
+
+    def test_set_and_get(self):
+        cache = TTLCache(ttl=60)
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+
+    def test_none_is_cached(self):
+        cache = TTLCache(ttl=60)
+        cache.set("key", None)
+        assert cache.get("key") is None
+
+    @patch("helpers.time.monotonic")
+    def test_entry_expires_after_ttl(self, mock_monotonic):
+        cache = TTLCache(ttl=60)
+        mock_monotonic.return_value = 1000.0
+        cache.set("key", "value")
+
+        mock_monotonic.return_value = 1059.9
+        assert cache.get("key") == "value"
+
+        mock_monotonic.return_value = 1060.0
+        assert cache.get("key") is MISSING
+
+    @patch("helpers.time.monotonic")
+    def test_set_refreshes_expiry(self, mock_monotonic):
+        cache = TTLCache(ttl=60)
+        mock_monotonic.return_value = 1000.0
+        cache.set("key", "old")
+
+        mock_monotonic.return_value = 1050.0
+        cache.set("key", "new")
+
+        mock_monotonic.return_value = 1100.0
+        assert cache.get("key") == "new"
+
+    def test_evicts_oldest_when_full(self):
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert cache.get("a") is MISSING
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_overwrite_does_not_evict(self):
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+
+        assert cache.get("a") == 10
+        assert cache.get("b") == 2
+
+    def test_clear(self):
+        cache = TTLCache(ttl=60)
+        cache.set("key", "value")
+        cache.clear()
+        assert cache.get("key") is MISSING
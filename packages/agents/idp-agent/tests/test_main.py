@@ -0,0 +1,165 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from main import filter_stream_event, invoke, serialize_tool_result_content
+
+REQUEST = {"prompt": [{"text": "hi"}], "session_id": "s", "project_id": "p", "user_id": "u"}
+
+
+def _mock_agent(events: list[dict]) -> MagicMock:
+    async def stream_async(_content):
+        for event in events:
+            yield event
+
+    agent = MagicMock()
+    agent.stream_async = stream_async
+    get_agent = MagicMock()
+    get_agent.return_value.__enter__.return_value = agent
+    return get_agent
+
+
+def _collect(request: dict) -> list[dict]:
+    async def run():
+        return [event async for event in invoke(request)]
+
+    return asyncio.run(run())
+
+
+class TestSerializeToolResultContent:
+    def test_text(self):
+        assert serialize_tool_result_content([{"text": "ok"}]) == [{"type": "text", "text": "ok"}]
+
+    def test_image_bytes_are_base64_encoded(self):
+        content = [{"image": {"format": "png", "source": {"bytes": b"\x89PNG"}}}]
+
+        assert serialize_tool_result_content(content) == [
+            {"type": "image", "image": {"format": "png", "source": {"bytes": "iVBORw=="}}}
+        ]
+
+    def test_image_without_bytes_passes_through(self):
+        image = {"format": "png", "source": {"s3Location": {"uri": "s3://bucket/key"}}}
+        assert serialize_tool_result_content([{"image": image}]) == [{"type": "image", "image": image}]
+
+    def test_unknown_item_passes_through(self):
+        assert serialize_tool_result_content([{"json": {"a": 1}}]) == [{"json": {"a": 1}}]
+
+
+class TestFilterStreamEvent:
+    def test_unrelated_event(self):
+        assert filter_stream_event({"init_event_loop": True}) == []
+
+    def test_text(self):
+        assert filter_stream_event({"data": "hello", "delta": {}}) == [{"type": "text", "content": "hello"}]
+
+    def test_tool_use(self):
+        event = {"current_tool_use": {"name": "search", "toolUseId": "t1", "input": '{"q": "x"}'}}
+
+        assert filter_stream_event(event) == [
+            {"type": "tool_use", "name": "search", "tool_use_id": "t1", "input": '{"q": "x"}'}
+        ]
+
+    def test_tool_use_without_name(self):
+        assert filter_stream_event({"current_tool_use": {"toolUseId": "t1"}}) == []
+
+    def test_tool_result(self):
+        event = {
+            "message": {
+                "role": "user",
+                "content": [
+                    {"toolResult": {"toolUseId": "t1", "status": "success", "content": [{"text": "done"}]}},
+                    {"text": "ignored"},
+                ],
+            }
+        }
+
+        assert filter_stream_event(event) == [
+            {
+                "type": "tool_result",
+                "tool_use_id": "t1",
+                "content": [{"type": "text", "text": "done"}],
+                "status": "success",
+            }
+        ]
+
+    def test_assistant_message_is_ignored(self):
+        assert filter_stream_event({"message": {"role": "assistant", "content": [{"text": "hi"}]}}) == []
+
+    def test_complete(self):
+        assert filter_stream_event({"complete": True}) == [{"type": "complete"}]
+        assert filter_stream_event({"complete": False}) == []
+
+    def test_falls_through_to_next_key(self):
+        event = {"current_tool_use": {}, "complete": True}
+        assert filter_stream_event(event) == [{"type": "complete"}]
+
+
+@patch("main.TEXT_FLUSH_INTERVAL_SECONDS", 3600)
+class TestInvokeTextCoalescing:
+    def test_text_deltas_are_joined(self):
+        events = [{"data": "Hel"}, {"data": "lo"}, {"data": "!"}]
+
+        with patch("main.get_agent", _mock_agent(events)):
+            assert _collect(REQUEST) == [{"type": "text", "content": "Hello!"}]
+
+    @patch("main.TEXT_FLUSH_MAX_PARTS", 2)
+    def test_flushes_at_max_parts(self):
+        events = [{"data": "a"}, {"data": "b"}, {"data": "c"}]
+
+        with patch("main.get_agent", _mock_agent(events)):
+            assert _collect(REQUEST) == [
+                {"type": "text", "content": "ab"},
+                {"type": "text", "content": "c"},
+            ]
+
+    def test_flushes_before_other_events(self):
+        events = [
+            {"data": "Let me "},
+            {"data": "search."},
+            {"current_tool_use": {"name": "search", "toolUseId": "t1"}},
+            {"data": "Done"},
+            {"complete": True},
+        ]
+
+        with patch("main.get_agent", _mock_agent(events)):
+            assert _collect(REQUEST) == [
+                {"type": "text", "content": "Let me search."},
+                {"type": "tool_use", "name": "search", "tool_use_id": "t1"},
+                {"type": "text", "content": "Done"},
+                {"type": "complete"},
+            ]
+
+    def test_trailing_text_is_flushed_before_slow_event(self):
+        async def run():
+            text_seen = asyncio.Event()
+
+            async def stream_async(_content):
+                yield {"data": "Searching"}
+                # Only continues once the buffered delta has reached the client
+                await asyncio.wait_for(text_seen.wait(), 1)
+                yield {"current_tool_use": {"name": "search", "toolUseId": "t1"}}
+
+            agent = MagicMock()
+            agent.stream_async = stream_async
+            get_agent = MagicMock()
+            get_agent.return_value.__enter__.return_value = agent
+
+            received = []
+            with patch("main.get_agent", get_agent), patch("main.TEXT_FLUSH_INTERVAL_SECONDS", 0.01):
+                async for event in invoke(REQUEST):
+                    received.append(event)
+                    if event["type"] == "text":
+                        text_seen.set()
+            return received
+
+        assert asyncio.run(run()) == [
+            {"type": "text", "content": "Searching"},
+            {"type": "tool_use", "name": "search", "tool_use_id": "t1"},
+        ]
+
+    def test_agent_receives_request_ids(self):
+        get_agent = _mock_agent([])
+
+        with patch("main.get_agent", get_agent):
+            assert _collect(REQUEST) == []
+
+        get_agent.assert_called_once_with(session_id="s", project_id="p", user_id="u", agent_id=None)
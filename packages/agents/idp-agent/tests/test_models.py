@@ -0,0 +1,100 @@
+import base64
+import re
+from unittest.mock import patch
+
+from models import ID_ALPHABET, ContentBlock, InvokeRequest, _short_id, sanitize_document_name
+
+BEDROCK_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9\s\-\(\)\[\]]+$")
+
+
+class TestShortId:
+    def test_default_length(self):
+        assert len(_short_id()) == 8
+
+    def test_custom_length(self):
+        assert len(_short_id(32)) == 32
+
+    def test_alphanumeric_only(self):
+        assert set(_short_id(256)) <= set(ID_ALPHABET)
+
+    def test_ids_differ(self):
+        assert len({_short_id() for _ in range(100)}) == 100
+
+    @patch("models.os.urandom")
+    def test_skips_biased_bytes(self, mock_urandom):
+        # 248 and above would bias byte % 62, so they are dropped and read again
+        mock_urandom.side_effect = [bytes([255, 248, 0, 61]), bytes([1, 62, 250, 250])]
+        assert _short_id(4) == "0Z10"
+
+
+class TestSanitizeDocumentName:
+    @patch("models._short_id", return_value="abc12345")
+    def test_strips_extension(self, _):
+        assert sanitize_document_name("report.pdf") == "report-abc12345"
+
+    @patch("models._short_id", return_value="abc12345")
+    def test_keeps_allowed_characters(self, _):
+        assert sanitize_document_name("Q1 report (final) [v2].docx") == "Q1 report (final) [v2]-abc12345"
+
+    @patch("models._short_id", return_value="abc12345")
+    def test_collapses_disallowed_runs(self, _):
+        assert sanitize_document_name("a_b..c--d!@#e.txt") == "a-b-c-d-e-abc12345"
+
+    @patch("models._short_id", return_value="abc12345")
+    def test_strips_edge_hyphens(self, _):
+        assert sanitize_document_name("__draft__.md") == "draft-abc12345"
+
+    @patch("models._short_id", return_value="abc12345")
+    def test_falls_back_when_nothing_remains(self, _):
+        assert sanitize_document_name("한글.pdf") == "doc-abc12345"
+
+    @patch("models._short_id", return_value="abc12345")
+    def test_truncates_long_names(self, _):
+        result = sanitize_document_name("x" * 500 + ".pdf")
+        assert result == "x" * 180 + "-abc12345"
+
+    def test_matches_bedrock_pattern(self):
+        result = sanitize_document_name("file_name@2024#final.pdf")
+        assert BEDROCK_NAME_PATTERN.match(result)
+
+    def test_unique_suffix(self):
+        assert sanitize_document_name("report.pdf") != sanitize_document_name("report.pdf")
+
+
+class TestContentBlock:
+    def test_text(self):
+        assert ContentBlock(text="hello").to_strands() == {"text": "hello"}
+
+    def test_image_base64_is_decoded(self):
+        block = ContentBlock.model_validate(
+            {"image": {"format": "png", "source": {"base64": base64.b64encode(b"\x89PNG").decode()}}}
+        )
+
+        assert block.image.source.data == b"\x89PNG"
+        assert block.to_strands() == {"image": {"format": "png", "source": {"bytes": b"\x89PNG"}}}
+
+    @patch("models._short_id", return_value="abc12345")
+    def test_document_name_is_sanitized(self, _):
+        block = ContentBlock.model_validate(
+            {
+                "document": {
+                    "format": "pdf",
+                    "name": "my_file.pdf",
+                    "source": {"base64": base64.b64encode(b"%PDF").decode()},
+                }
+            }
+        )
+
+        assert block.to_strands() == {
+            "document": {"format": "pdf", "name": "my-file-abc12345", "source": {"bytes": b"%PDF"}}
+        }
+
+    def test_empty_block(self):
+        assert ContentBlock().to_strands() == {"text": ""}
+
+    def test_invoke_request(self):
+        request = InvokeRequest.model_validate({"prompt": [{"text": "hi"}], "session_id": "s", "project_id": "p"})
+
+        assert request.prompt[0].text == "hi"
+        assert request.user_id is None
+        assert request.agent_id is None
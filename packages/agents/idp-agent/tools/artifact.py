@@ -1,10 +1,9 @@
-from nanoid import generate as nanoid_generate
+import secrets
+
 from strands import tool
 
 from config import get_config
 
-NANOID_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ-_"
-
 
 def create_artifact_path_tool(
     user_id: str | None = None,
@@ -26,7 +25,8 @@ def create_artifact_path_tool(
             Dictionary with s3_uri, bucket, key, and artifact markdown reference.
         """
         config = get_config()
-        artifact_id = f"art_{nanoid_generate(NANOID_ALPHABET, 12)}"
+        # 9 random bytes -> 12 URL-safe chars, same alphabet and length as the previous nanoid ids
+        artifact_id = f"art_{secrets.token_urlsafe(9)}"
         bucket = config.agent_storage_bucket_name
         key = f"{user_id}/{project_id}/artifacts/{artifact_id}/{filename}"
 
@@ -36,17 +36,8 @@ class PcmCaptureProcessor extends AudioWorkletProcessor {
 registerProcessor('pcm-capture-processor', PcmCaptureProcessor);
 `;
 
-function arrayBufferToBase64(buffer: ArrayBuffer): string {
-  const bytes = new Uint8Array(buffer);
-  let binary = '';
-  for (let i = 0; i < bytes.byteLength; i++) {
-    binary += String.fromCharCode(bytes[i]);
-  }
-  return btoa(binary);
-}
-
 interface UseAudioCaptureOptions {
-  onAudioChunk: (base64Pcm: string) => void;
+  onAudioChunk: (pcm: ArrayBuffer) => void;
   onAudioLevel?: (level: number) => void;
 }
 
@@ -111,8 +102,7 @@ export function useAudioCapture({
 
     workletNode.port.onmessage = (event) => {
       if (event.data.type === 'audio') {
-        const base64 = arrayBufferToBase64(event.data.samples);
-        onAudioChunkRef.current(base64);
+        onAudioChunkRef.current(event.data.samples);
       }
     };
 
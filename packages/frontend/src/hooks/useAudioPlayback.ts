@@ -1,18 +1,9 @@
 import { useState, useRef, useCallback } from 'react';
 import { calculateAudioLevel } from '../lib/audioUtils';
 
-function base64ToInt16Array(base64: string): Int16Array {
-  const binary = atob(base64);
-  const bytes = new Uint8Array(binary.length);
-  for (let i = 0; i < binary.length; i++) {
-    bytes[i] = binary.charCodeAt(i);
-  }
-  return new Int16Array(bytes.buffer);
-}
-
 export interface UseAudioPlaybackReturn {
   isPlaying: boolean;
-  enqueueAudio: (base64Pcm: string, sampleRate: number) => void;
+  enqueueAudio: (pcm: Int16Array, sampleRate: number) => void;
   stop: () => void;
   audioLevel: number;
 }
@@ -64,12 +55,11 @@ export function useAudioPlayback(): UseAudioPlaybackReturn {
   }, []);
 
   const enqueueAudio = useCallback(
-    (base64Pcm: string, sampleRate: number) => {
+    (int16: Int16Array, sampleRate: number) => {
       const ctx = getAudioContext();
       const analyser = analyserRef.current;
       if (!analyser) return;
 
-      const int16 = base64ToInt16Array(base64Pcm);
       const float32 = new Float32Array(int16.length);
       for (let i = 0; i < int16.length; i++) {
         float32[i] = int16[i] / 32768;
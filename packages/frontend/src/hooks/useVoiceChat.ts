@@ -94,10 +94,11 @@ export function useVoiceChat(options: UseVoiceChatOptions): UseVoiceChatReturn {
 
   const playback = useAudioPlayback();
 
-  const handleAudioChunk = useCallback((base64Pcm: string) => {
+  const handleAudioChunk = useCallback((pcm: ArrayBuffer) => {
     const ws = wsRef.current;
     if (ws && ws.readyState === WebSocket.OPEN) {
-      ws.send(JSON.stringify({ type: 'audio', audio: base64Pcm }));
+      // Raw PCM goes out as a binary frame; control messages stay JSON text
+      ws.send(pcm);
     }
   }, []);
 
@@ -176,6 +177,7 @@ export function useVoiceChat(options: UseVoiceChatOptions): UseVoiceChatReturn {
 
         console.log('[VoiceChat] Creating WebSocket...');
         const ws = new WebSocket(signedUrl);
+        ws.binaryType = 'arraybuffer';
         wsRef.current = ws;
 
         ws.onopen = () => {
@@ -229,100 +231,112 @@ export function useVoiceChat(options: UseVoiceChatOptions): UseVoiceChatReturn {
           }, 3000);
         };
 
-        ws.onmessage = (event) => {
-          messageCountRef.current += 1;
+        // Binary frames are audio: u32 little-endian sample rate + 16-bit PCM
+        const handleAudioFrame = (frame: ArrayBuffer) => {
           try {
-            const data = JSON.parse(event.data);
-
-            switch (data.type) {
-              case 'audio':
-                try {
-                  playback.enqueueAudio(data.audio, data.sample_rate);
-                  setState((s) => ({ ...s, isSpeaking: true }));
-                } catch (audioErr) {
-                  console.error('[VoiceChat] Audio playback error:', audioErr);
-                }
-                break;
-
-              case 'transcript':
-                for (const cb of transcriptCallbacksRef.current) {
-                  cb(data.text, data.role, data.is_final);
-                }
-                break;
-
-              case 'response_start':
-                setState((s) => ({ ...s, isSpeaking: true }));
-                // Notify listeners that assistant started responding
-                // This signals that user's turn is complete
-                for (const cb of responseStartCallbacksRef.current) {
-                  cb();
-                }
-                break;
-
-              case 'response_complete':
-                setState((s) => ({ ...s, isSpeaking: false }));
-                // Notify listeners that assistant finished responding
-                for (const cb of responseCompleteCallbacksRef.current) {
-                  cb();
-                }
-                break;
-
-              case 'interruption':
-                playback.stop();
-                setState((s) => ({ ...s, isSpeaking: false }));
-                break;
-
-              case 'tool_use':
-                console.log('[VoiceChat] tool_use received:', data.tool_name);
-                for (const cb of toolUseCallbacksRef.current) {
-                  cb(data.tool_name, data.tool_use_id, 'started');
-                }
-                break;
-
-              case 'tool_result':
-                console.log(
-                  '[VoiceChat] tool_result received:',
+            const sampleRate = new DataView(frame).getUint32(0, true);
+            playback.enqueueAudio(new Int16Array(frame, 4), sampleRate);
+            setState((s) => ({ ...s, isSpeaking: true }));
+          } catch (audioErr) {
+            console.error('[VoiceChat] Audio playback error:', audioErr);
+          }
+        };
+
+        // eslint-disable-next-line @typescript-eslint/no-explicit-any
+        const handleMessage = (data: any) => {
+          switch (data.type) {
+            case 'batch':
+              // Server coalesces small control events into one frame
+              for (const item of data.items) {
+                handleMessage(item);
+              }
+              break;
+
+            case 'transcript':
+              for (const cb of transcriptCallbacksRef.current) {
+                cb(data.text, data.role, data.is_final);
+              }
+              break;
+
+            case 'response_start':
+              setState((s) => ({ ...s, isSpeaking: true }));
+              // Notify listeners that assistant started responding
+              // This signals that user's turn is complete
+              for (const cb of responseStartCallbacksRef.current) {
+                cb();
+              }
+              break;
+
+            case 'response_complete':
+              setState((s) => ({ ...s, isSpeaking: false }));
+              // Notify listeners that assistant finished responding
+              for (const cb of responseCompleteCallbacksRef.current) {
+                cb();
+              }
+              break;
+
+            case 'interruption':
+              playback.stop();
+              setState((s) => ({ ...s, isSpeaking: false }));
+              break;
+
+            case 'tool_use':
+              console.log('[VoiceChat] tool_use received:', data.tool_name);
+              for (const cb of toolUseCallbacksRef.current) {
+                cb(data.tool_name, data.tool_use_id, 'started');
+              }
+              break;
+
+            case 'tool_result':
+              console.log(
+                '[VoiceChat] tool_result received:',
+                data.tool_name,
+                data.status,
+              );
+              for (const cb of toolUseCallbacksRef.current) {
+                cb(
                   data.tool_name,
-                  data.status,
-                );
-                for (const cb of toolUseCallbacksRef.current) {
-                  cb(
-                    data.tool_name,
-                    data.tool_use_id,
-                    data.status === 'success' ? 'success' : 'error',
-                  );
-                }
-                break;
-
-              case 'timeout':
-                console.log('[VoiceChat] Session timed out:', data.reason);
-                pendingDisconnectReasonRef.current = 'timeout';
-                ws.close();
-                break;
-
-              case 'error':
-                console.error('[VoiceChat] Server error:', data.message);
-                pendingDisconnectReasonRef.current = 'error';
-                break;
-
-              case 'connection_start':
-                console.log(
-                  '[VoiceChat] Connection started:',
-                  data.connection_id,
+                  data.tool_use_id,
+                  data.status === 'success' ? 'success' : 'error',
                 );
-                break;
-
-              case 'pong':
-                console.log('[VoiceChat] Pong received');
-                break;
+              }
+              break;
+
+            case 'timeout':
+              console.log('[VoiceChat] Session timed out:', data.reason);
+              pendingDisconnectReasonRef.current = 'timeout';
+              ws.close();
+              break;
+
+            case 'error':
+              console.error('[VoiceChat] Server error:', data.message);
+              pendingDisconnectReasonRef.current = 'error';
+              break;
+
+            case 'connection_start':
+              console.log(
+                '[VoiceChat] Connection started:',
+                data.connection_id,
+              );
+              break;
+
+            case 'pong':
+              console.log('[VoiceChat] Pong received');
+              break;
+
+            default:
+              console.log('[VoiceChat] Unknown message type:', data.type, data);
+          }
+        };
 
-              default:
-                console.log(
-                  '[VoiceChat] Unknown message type:',
-                  data.type,
-                  data,
-                );
-            }
+        ws.onmessage = (event) => {
+          messageCountRef.current += 1;
+          if (event.data instanceof ArrayBuffer) {
+            handleAudioFrame(event.data);
+            return;
+          }
+          try {
+            handleMessage(JSON.parse(event.data));
           } catch (parseErr) {
             console.warn('[VoiceChat] Failed to parse message:', parseErr);
           }